@@ -1,60 +1,160 @@
 #!/usr/bin/env python3
 """Development script that auto-restarts the GUI on file changes."""
 
+import os
+import signal
 import subprocess
 import sys
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 try:
-    from watchdog.events import FileSystemEventHandler
+    from watchdog.events import PatternMatchingEventHandler
     from watchdog.observers import Observer
 except ImportError:
     print("Installing watchdog...")
     subprocess.check_call([sys.executable, "-m", "pip", "install", "watchdog"])
-    from watchdog.events import FileSystemEventHandler
+    from watchdog.events import PatternMatchingEventHandler
     from watchdog.observers import Observer
 
 
-class RestartHandler(FileSystemEventHandler):
+# Seconds of quiet after the last change before restarting
+DEBOUNCE = 0.2
+
+# Seconds to wait for the old process to exit after SIGTERM before killing it
+GRACE_PERIOD = 2.0
+
+# Bytecode caches and editor swap/backup files that should never trigger a restart
+IGNORE_PATTERNS = ["*/__pycache__/*", "*.pyc", "*~", "*.swp", "*/.#*"]
+
+
+class RestartHandler(PatternMatchingEventHandler):
     def __init__(self):
+        super().__init__(
+            patterns=["*.py"],
+            ignore_patterns=IGNORE_PATTERNS,
+            ignore_directories=True,
+        )
         self.process: subprocess.Popen | None = None
-        self.restart_pending = False
-        self.last_restart = 0
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._pending: set[str] = set()
+        self._stopped = False
+        # Single worker owns the child process so waiting for it to exit
+        # never blocks watchdog's event dispatch thread.
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="restart")
 
     def start_app(self):
-        if self.process:
-            self.process.terminate()
-            self.process.wait()
+        with self._lock:
+            # A debounce timer can still fire after stop() shut the worker down
+            if not self._stopped:
+                self._worker.submit(self._restart)
+
+    def _restart(self):
+        self._terminate()
         print("\n🚀 Starting TTAI...")
         self.process = subprocess.Popen(
             [sys.executable, "-m", "src.server.main"],
             cwd=Path(__file__).parent,
+            # Own process group so the whole tree can be signalled at once
+            start_new_session=os.name == "posix",
         )
-        self.last_restart = time.time()
 
-    def on_modified(self, event):
-        if event.is_directory:
-            return
-        if not event.src_path.endswith(".py"):
-            return
-        # Debounce - don't restart more than once per second
-        if time.time() - self.last_restart < 1:
+    def _terminate(self):
+        process, self.process = self.process, None
+        if process is None or process.poll() is not None:
             return
-        print(f"📝 Changed: {event.src_path}")
+        self._signal(process, force=False)
+        try:
+            process.wait(timeout=GRACE_PERIOD)
+        except subprocess.TimeoutExpired:
+            print("⚠️  Process did not exit in time, killing...")
+            self._signal(process, force=True)
+            process.wait()
+
+    @staticmethod
+    def _signal(process: subprocess.Popen, force: bool):
+        try:
+            if os.name == "posix":
+                os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+            elif force:
+                process.kill()
+            else:
+                process.terminate()
+        except ProcessLookupError:
+            pass
+
+    def on_modified(self, event):
+        # Trailing-edge debounce: each event pushes the restart back, so an
+        # editor's save burst collapses into a single restart.
+        with self._lock:
+            self._pending.add(event.src_path)
+            if self._timer:
+                self._timer.cancel()
+            self._timer = threading.Timer(DEBOUNCE, self._flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush(self):
+        with self._lock:
+            changed = sorted(self._pending)
+            self._pending.clear()
+            self._timer = None
+        for path in changed:
+            print(f"📝 Changed: {path}")
         self.start_app()
 
     def stop(self):
-        if self.process:
-            self.process.terminate()
-            self.process.wait()
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+        self._worker.submit(self._terminate).result()
+        self._worker.shutdown()
+
+
+def create_observer():
+    """Pick the native observer explicitly so we never silently fall back to kqueue.
+
+    FSEvents delivers one coalesced stream for the whole tree (kqueue needs an fd
+    per watched file); the short timeout keeps the first reload snappy.
+    """
+    if sys.platform == "darwin":
+        try:
+            from watchdog.observers.fsevents import FSEventsObserver
+
+            return FSEventsObserver(timeout=0.1)
+        except ImportError:
+            pass
+    elif sys.platform.startswith("linux"):
+        try:
+            from watchdog.observers.inotify import InotifyObserver
+
+            return InotifyObserver(timeout=0.1)
+        except ImportError:
+            pass
+    return Observer()
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
 
 
 def main():
+    # The app runs in its own session, so it won't get the signals that kill
+    # this script; route them through the same cleanup as Ctrl+C
+    for name in ("SIGTERM", "SIGHUP"):
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name), _interrupt)
+
     src_path = Path(__file__).parent / "src"
 
     handler = RestartHandler()
-    observer = Observer()
+    observer = create_observer()
     observer.schedule(handler, str(src_path), recursive=True)
     observer.start()
 
@@ -62,13 +162,17 @@ def main():
     handler.start_app()
 
     try:
-        while True:
-            time.sleep(1)
+        # Block on the observer thread instead of polling; Ctrl+C still
+        # interrupts the join with KeyboardInterrupt.
+        observer.join()
     except KeyboardInterrupt:
         print("\n👋 Stopping...")
+    finally:
+        # The app runs in its own session, so however this loop ends it must
+        # be stopped here or it is left running
         handler.stop()
         observer.stop()
-    observer.join()
+        observer.join()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,68 @@
+"""PyInstaller pre-find hook that trims what the PySide6 hooks collect.
+
+PyInstaller's Qt hooks bundle every plugin type and translation associated with
+each Qt library they see. TTAI is a small widgets app, so most of that is dead
+weight that cleanup_bundle would otherwise delete after the fact. This hook runs
+before any PySide6 module is analyzed and wraps the shared QtLibraryInfo so the
+unused files are never collected in the first place.
+"""
+
+import os
+
+from PyInstaller.utils.hooks.qt import pyside6_library_info
+
+# Plugin types the app never loads
+EXCLUDED_PLUGIN_TYPES = {
+    "multimedia",
+    "qmltooling",
+    "scenegraph",
+    "qmllint",
+    "designer",
+    "sqldrivers",
+    "webview",
+    "position",
+    "sensors",
+    "texttospeech",
+    "canbus",
+    "virtualkeyboard",
+    "geometryloaders",
+    "sceneparsers",
+    "renderers",
+    "assetimporters",
+    "renderplugins",
+    "printsupport",
+}
+
+# Individual plugins within otherwise-needed types (matched on file name prefix,
+# with or without the "lib" prefix used on Linux/macOS)
+EXCLUDED_PLUGINS = ("qminimal", "qoffscreen", "qwebgl", "qvirtualkeyboardplugin", "qpdf")
+
+
+def _is_excluded_plugin(path: str) -> bool:
+    name = os.path.basename(path).removeprefix("lib")
+    return name.startswith(EXCLUDED_PLUGINS)
+
+
+def pre_find_module_path(hook_api):
+    # Marked on the shared object itself, since this hook module may be
+    # executed more than once; the attribute isn't part of its declared type
+    if getattr(pyside6_library_info, "_ttai_trimmed", False):
+        return
+    setattr(pyside6_library_info, "_ttai_trimmed", True)
+
+    collect_plugins = pyside6_library_info.collect_plugins
+    collect_module = pyside6_library_info.collect_module
+
+    def trimmed_collect_plugins(plugin_type):
+        if plugin_type in EXCLUDED_PLUGIN_TYPES:
+            return []
+        return [b for b in collect_plugins(plugin_type) if not _is_excluded_plugin(b[0])]
+
+    def trimmed_collect_module(module_name):
+        hiddenimports, binaries, datas = collect_module(module_name)
+        # The app is English-only; drop Qt's translation catalogs
+        datas = [d for d in datas if os.path.basename(d[1]) != "translations"]
+        return hiddenimports, binaries, datas
+
+    pyside6_library_info.collect_plugins = trimmed_collect_plugins
+    pyside6_library_info.collect_module = trimmed_collect_module
@@ -11,45 +11,106 @@ Usage:
     uv run python scripts/build.py
 """
 
+import ast
+import fnmatch
+import functools
+import hashlib
+import os
 import platform
+import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import zipfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    from PIL import Image
+except ImportError:  # optional: .icns falls back to sips, .ico is skipped
+    Image = None
+
 # Application name
 APP_NAME = "TTAI"
 
 # Icon sizes required for macOS .icns
 ICNS_SIZES = [16, 32, 64, 128, 256, 512, 1024]
 
+# Distribution zip compression modes: (zipfile method, level)
+# - deflate: fast, opens everywhere (default)
+# - lzma: 20-40% smaller, but macOS Archive Utility can't extract it
+# - store: no compression, fastest (e.g. for CI artifacts)
+ARCHIVE_COMPRESSION: dict[str, tuple[int, int | None]] = {
+    "deflate": (zipfile.ZIP_DEFLATED, 1),
+    "lzma": (zipfile.ZIP_LZMA, None),
+    "store": (zipfile.ZIP_STORED, None),
+}
+
+# Bytes of small files read ahead of the zip writer at a time; files at or
+# above ZIP_STREAM_THRESHOLD are streamed from disk by ZipFile.write instead
+ZIP_READ_AHEAD_BYTES = 64 * 1024 * 1024
+ZIP_STREAM_THRESHOLD = 8 * 1024 * 1024
+
+# Binaries UPX must not touch (Qt libraries fail to load once compressed).
+# Qt is named Qt6Core.dll on Windows and libQt6Core.so.6 on Linux
+_UPX_EXCLUDE_QT = ["Qt6Core*", "Qt6Gui*", "Qt6Widgets*", "Qt6Svg*", "Qt6WebEngineCore*"]
+UPX_EXCLUDE = [
+    *_UPX_EXCLUDE_QT,
+    *(f"lib{pattern}" for pattern in _UPX_EXCLUDE_QT),
+    "qwindows.dll",
+    "vcruntime140.dll",
+    "python3*.dll",
+]
+
+
+def _resize_with_pillow(image: "Image.Image", size: int, out_file: Path) -> None:
+    """Write a square PNG of image at size (image is owned by the caller's thread)."""
+    assert Image is not None
+    image.resize((size, size), Image.Resampling.LANCZOS).save(out_file)
+
+
+def _resize_with_sips(png_path: Path, size: int, out_file: Path) -> None:
+    """Write a square PNG of png_path at size using macOS sips."""
+    subprocess.run(
+        ["sips", "-z", str(size), str(size), str(png_path), "--out", str(out_file)],
+        capture_output=True,
+        check=True,
+    )
+
 
 def create_icns(png_path: Path, output_path: Path) -> bool:
-    """Create macOS .icns file from PNG using sips and iconutil."""
+    """Create macOS .icns file from PNG using Pillow (or sips) and iconutil."""
     try:
         with tempfile.TemporaryDirectory() as tmpdir:
             iconset_dir = Path(tmpdir) / "icon.iconset"
             iconset_dir.mkdir()
 
-            # Generate all required sizes
-            for size in ICNS_SIZES:
-                # Standard resolution
-                out_file = iconset_dir / f"icon_{size}x{size}.png"
-                subprocess.run(
-                    ["sips", "-z", str(size), str(size), str(png_path), "--out", str(out_file)],
-                    capture_output=True,
-                    check=True,
-                )
-                # Retina (@2x) - only for sizes up to 512
-                if size <= 512:
-                    out_file_2x = iconset_dir / f"icon_{size}x{size}@2x.png"
-                    size_2x = size * 2
-                    subprocess.run(
-                        ["sips", "-z", str(size_2x), str(size_2x), str(png_path), "--out", str(out_file_2x)],
-                        capture_output=True,
-                        check=True,
-                    )
+            # Standard resolution for every size, plus Retina (@2x) up to 512
+            targets = [(size, iconset_dir / f"icon_{size}x{size}.png") for size in ICNS_SIZES]
+            targets += [
+                (size * 2, iconset_dir / f"icon_{size}x{size}@2x.png")
+                for size in ICNS_SIZES
+                if size <= 512
+            ]
+
+            jobs: list[tuple[Callable[..., None], tuple]]
+            if Image is not None:
+                # Decode the source once. Pillow images must not be shared
+                # between threads, so each worker gets its own copy
+                with Image.open(png_path) as source:
+                    source.load()
+                    jobs = [(_resize_with_pillow, (source.copy(), *target)) for target in targets]
+            else:
+                jobs = [(_resize_with_sips, (png_path, *target)) for target in targets]
+
+            # Sizes are independent (Pillow releases the GIL while resizing and
+            # encoding; sips runs as separate processes), so generate them in parallel
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                for future in [executor.submit(func, *args) for func, args in jobs]:
+                    future.result()
 
             # Convert iconset to icns
             subprocess.run(
@@ -58,7 +119,7 @@ def create_icns(png_path: Path, output_path: Path) -> bool:
                 check=True,
             )
             return True
-    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+    except (subprocess.CalledProcessError, OSError) as e:
         print(f"Warning: Could not create .icns file: {e}")
         return False
 
@@ -68,9 +129,14 @@ def create_ico(png_path: Path, output_path: Path) -> bool:
     try:
         from PIL import Image
 
-        img = Image.open(png_path)
         # Windows ico typically includes these sizes
         sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
+        with Image.open(png_path) as source:
+            # Decode and convert once; the encoder downscales every entry from
+            # this buffer, so shrink to the largest entry up front
+            img = source.convert("RGBA")
+        if img.width > 256 or img.height > 256:
+            img = img.resize((256, 256), Image.Resampling.LANCZOS)
         img.save(output_path, format="ICO", sizes=sizes)
         return True
     except ImportError:
@@ -81,6 +147,94 @@ def create_ico(png_path: Path, output_path: Path) -> bool:
         return False
 
 
+def create_icon(system: str, icon_png: Path, build_dir: Path) -> Path | None:
+    """Create the platform-specific app icon in build_dir.
+
+    Returns:
+        Path to the icon, or None if the platform needs none or creation failed
+    """
+    if not icon_png.exists():
+        return None
+
+    if system == "darwin":
+        icon_path = build_dir / "icon.icns"
+        build_dir.mkdir(parents=True, exist_ok=True)
+        if create_icns(icon_png, icon_path):
+            print(f"Created macOS icon: {icon_path}")
+            return icon_path
+    elif system == "windows":
+        icon_path = build_dir / "icon.ico"
+        build_dir.mkdir(parents=True, exist_ok=True)
+        if create_ico(icon_png, icon_path):
+            print(f"Created Windows icon: {icon_path}")
+            return icon_path
+    return None
+
+
+def prebake_tray_icons(resources_dir: Path) -> None:
+    """Write pre-colored variants of the tray icon next to pulse.svg.
+
+    The tray icon is black on macOS (a template image) and white elsewhere;
+    shipping both variants saves the app substituting currentColor at startup.
+    Must match the variants in src/gui/system_tray.py.
+
+    Args:
+        resources_dir: GUI resources directory containing pulse.svg
+    """
+    source = resources_dir / "pulse.svg"
+    svg_data = source.read_bytes()
+    for variant, color in (("dark", b"#000000"), ("light", b"#FFFFFF")):
+        variant_path = resources_dir / f"pulse.{variant}.svg"
+        variant_path.write_bytes(svg_data.replace(b"currentColor", color))
+
+
+def compile_qt_resources(qrc_path: Path, output_path: Path) -> bool:
+    """Compile the GUI's Qt resource file into an importable Python module.
+
+    The app loads its SVG icons from this in-memory resource table when it is
+    present, so no icon files have to be read (from _MEIPASS) at startup.
+
+    Args:
+        qrc_path: Path to the .qrc resource collection
+        output_path: Path of the generated Python module
+
+    When compilation is skipped, a module left over from an earlier build is
+    removed so it can't be bundled with stale icons.
+
+    Returns:
+        True if the module was generated
+    """
+    rcc = shutil.which("pyside6-rcc")
+    if rcc is None:
+        print("Warning: pyside6-rcc not found, icons will be loaded from files")
+        output_path.unlink(missing_ok=True)
+        return False
+    result = subprocess.run(
+        [rcc, str(qrc_path), "-o", str(output_path)],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(f"Warning: pyside6-rcc failed: {result.stderr.strip()}")
+        output_path.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def _dir_size(path: Path) -> int:
+    """Total size in bytes of all regular files under path (symlinks not followed)."""
+    total = 0
+    stack = [str(path)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
 def cleanup_bundle(bundle_path: Path) -> None:
     """Remove unnecessary files from the app bundle to reduce size."""
     # Patterns to remove (Qt frameworks and files we don't need)
@@ -154,31 +308,25 @@ def cleanup_bundle(bundle_path: Path) -> None:
         if not frameworks_dir.exists():
             return
 
-    removed_size = 0
+    # Collect everything to delete first (label for logging), then remove in bulk
+    targets: dict[Path, str] = {}
 
-    # Remove Qt frameworks matching patterns
+    # Qt frameworks matching patterns
     qt_lib_dir = frameworks_dir / "PySide6" / "Qt" / "lib"
     if qt_lib_dir.exists():
-        import fnmatch
-        for pattern in remove_patterns:
-            for item in qt_lib_dir.iterdir():
-                if fnmatch.fnmatch(item.name, pattern) or fnmatch.fnmatch(item.name, f"{pattern}.framework"):
-                    if item.exists() or item.is_symlink():
-                        if item.is_symlink():
-                            item.unlink()
-                            print(f"  Removed symlink: {item.name}")
-                        elif item.is_dir():
-                            size = sum(f.stat().st_size for f in item.rglob("*") if f.is_file())
-                            removed_size += size
-                            shutil.rmtree(item)
-                            print(f"  Removed: {item.name} ({size / 1024 / 1024:.1f} MB)")
-                        else:
-                            size = item.stat().st_size
-                            removed_size += size
-                            item.unlink()
-                            print(f"  Removed: {item.name} ({size / 1024 / 1024:.1f} MB)")
-
-    # Remove Qt plugins we don't need
+        # One union regex (each pattern also as a .framework) and a single pass
+        remove_re = re.compile(
+            "|".join(
+                fnmatch.translate(p)
+                for pattern in remove_patterns
+                for p in (pattern, f"{pattern}.framework")
+            )
+        )
+        for item in qt_lib_dir.iterdir():
+            if remove_re.match(item.name):
+                targets[item] = item.name
+
+    # Qt plugins we don't need
     qt_plugins_dir = frameworks_dir / "PySide6" / "Qt" / "plugins"
     if qt_plugins_dir.exists():
         plugins_to_remove = [
@@ -190,31 +338,212 @@ def cleanup_bundle(bundle_path: Path) -> None:
         for plugin_name in plugins_to_remove:
             plugin_dir = qt_plugins_dir / plugin_name
             if plugin_dir.exists() or plugin_dir.is_symlink():
-                if plugin_dir.is_symlink():
-                    plugin_dir.unlink()
-                    print(f"  Removed plugin symlink: {plugin_name}")
-                else:
-                    size = sum(f.stat().st_size for f in plugin_dir.rglob("*") if f.is_file())
-                    removed_size += size
-                    shutil.rmtree(plugin_dir)
-                    print(f"  Removed plugin: {plugin_name} ({size / 1024 / 1024:.1f} MB)")
-
-    # Remove complete directories
+                targets[plugin_dir] = f"plugin {plugin_name}"
+
+    # Complete directories
     for dir_pattern in remove_dirs:
         dir_path = frameworks_dir / dir_pattern
         if dir_path.exists() or dir_path.is_symlink():
-            if dir_path.is_symlink():
-                dir_path.unlink()
-                print(f"  Removed symlink: {dir_pattern}")
-            else:
-                size = sum(f.stat().st_size for f in dir_path.rglob("*") if f.is_file())
-                removed_size += size
-                shutil.rmtree(dir_path)
-                print(f"  Removed: {dir_pattern} ({size / 1024 / 1024:.1f} MB)")
+            targets[dir_path] = dir_pattern
+
+    def remove(path: Path) -> int | None:
+        """Delete path and return the bytes freed (None for a symlink)."""
+        if path.is_symlink():
+            path.unlink()
+            return None
+        if path.is_dir():
+            size = _dir_size(path)
+            shutil.rmtree(path)
+            return size
+        size = path.stat().st_size
+        path.unlink()
+        return size
+
+    # Deletion is pure unlink/rmdir syscall latency, so overlap it. Windows
+    # gets a single worker: concurrent deletes under one root can race there.
+    workers = 1 if sys.platform == "win32" else 8
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        sizes = list(executor.map(remove, targets))
+
+    removed_size = 0
+    for label, size in zip(targets.values(), sizes):
+        if size is None:
+            print(f"  Removed symlink: {label}")
+        else:
+            removed_size += size
+            print(f"  Removed: {label} ({size / 1024 / 1024:.1f} MB)")
 
     print(f"\nTotal removed: {removed_size / 1024 / 1024:.1f} MB")
 
 
+def run_streaming(
+    cmd: list[str],
+    cwd: Path,
+    while_running: Callable[[], None] | None = None,
+) -> int:
+    """Run cmd, echoing its output from a reader thread, and return its exit code.
+
+    while_running is called on this thread once the process has started, so
+    independent prep work overlaps with the subprocess instead of waiting on it.
+    If it raises, the process is killed before the error propagates.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        # Undecodable bytes must not kill the reader, or the pipe fills and
+        # the process blocks forever
+        errors="replace",
+        bufsize=1,
+    )
+
+    def pump() -> None:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            sys.stdout.write(line)
+        sys.stdout.flush()
+
+    reader = threading.Thread(target=pump, daemon=True)
+    reader.start()
+    if while_running:
+        try:
+            while_running()
+        except BaseException:
+            proc.kill()
+            proc.wait()
+            reader.join()
+            raise
+    returncode = proc.wait()
+    reader.join()
+    return returncode
+
+
+def get_archive_compression() -> tuple[int, int | None]:
+    """Resolve TTAI_ARCHIVE_COMPRESSION (see ARCHIVE_COMPRESSION).
+
+    The default is fast deflate (level 1) rather than make_archive's level 6: the
+    bundle is hundreds of MB and the size difference is a few percent.
+
+    Raises:
+        ValueError: If the variable names an unknown mode
+    """
+    method = os.environ.get("TTAI_ARCHIVE_COMPRESSION", "deflate").lower()
+    if method not in ARCHIVE_COMPRESSION:
+        raise ValueError(
+            f"Unknown TTAI_ARCHIVE_COMPRESSION {method!r}, "
+            f"expected one of {list(ARCHIVE_COMPRESSION)}"
+        )
+    return ARCHIVE_COMPRESSION[method]
+
+
+def make_zip(
+    zip_path: Path,
+    root_dir: Path,
+    base_dir: str,
+    archive_compression: tuple[int, int | None],
+) -> int:
+    """Zip root_dir/base_dir into zip_path with paths relative to root_dir.
+
+    Returns the total size of the archived files, tallied during the same walk
+    so the bundle is only traversed once.
+
+    archive_compression is a (zipfile method, level) pair from
+    get_archive_compression.
+    """
+    compression, compresslevel = archive_compression
+
+    total = 0
+    with (
+        zipfile.ZipFile(zip_path, "w", compression=compression, compresslevel=compresslevel) as zf,
+        ThreadPoolExecutor(max_workers=4) as readers,
+    ):
+        stack = [root_dir / base_dir]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+            files: list[tuple[Path, int]] = []
+            for entry in entries:
+                path = Path(entry.path)
+                if entry.is_dir():
+                    zf.write(path, path.relative_to(root_dir))
+                    # Like os.walk, list symlinked directories but don't descend
+                    if not entry.is_symlink():
+                        stack.append(path)
+                elif entry.is_file():
+                    files.append((path, entry.stat().st_size))
+
+            # ZipFile compresses one entry at a time, so read the next small
+            # files from disk in worker threads while the current one is being
+            # compressed. Batches are capped in bytes, and large libraries are
+            # streamed, so memory stays bounded however big the bundle is
+            batch: list[Path] = []
+            batch_bytes = 0
+
+            def flush() -> None:
+                nonlocal batch_bytes
+                for path, data in zip(batch, readers.map(Path.read_bytes, batch)):
+                    info = zipfile.ZipInfo.from_file(path, path.relative_to(root_dir))
+                    zf.writestr(info, data, compress_type=compression, compresslevel=compresslevel)
+                batch.clear()
+                batch_bytes = 0
+
+            for path, size in files:
+                total += size
+                if size >= ZIP_STREAM_THRESHOLD:
+                    flush()
+                    zf.write(path, path.relative_to(root_dir))
+                    continue
+                if batch_bytes + size > ZIP_READ_AHEAD_BYTES:
+                    flush()
+                batch.append(path)
+                batch_bytes += size
+            flush()
+    return total
+
+
+def get_incremental_mode() -> bool | None:
+    """Resolve TTAI_INCREMENTAL.
+
+    Returns:
+        True to always reuse PyInstaller's cache, False to always clean, or
+        None (unset or unrecognized) to decide from the build cache key
+    """
+    value = os.environ.get("TTAI_INCREMENTAL")
+    if value is None:
+        return None
+    value = value.strip().lower()
+    if value in ("1", "true", "yes", "on"):
+        return True
+    if value in ("0", "false", "no", "off", ""):
+        return False
+    print(f"Warning: ignoring unrecognized TTAI_INCREMENTAL={value!r}")
+    return None
+
+
+def build_cache_key(cmd: list[str], lockfile: Path) -> str:
+    """Hash the PyInstaller command line and locked dependencies.
+
+    When neither changes, PyInstaller's cached analysis in the work dir is still
+    valid (it tracks source file changes itself) and --clean can be skipped.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((cmd, sys.version)).encode())
+    if lockfile.exists():
+        digest.update(lockfile.read_bytes())
+    return digest.hexdigest()
+
+
+def remove_path(path: Path) -> None:
+    """Remove a file, symlink or directory tree if it exists."""
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    elif path.exists() or path.is_symlink():
+        path.unlink()
+
+
+@functools.cache
 def get_target_triple() -> str:
     """Determine the target triple for the current platform."""
     machine = platform.machine().lower()
@@ -234,80 +563,59 @@ def get_target_triple() -> str:
         raise RuntimeError(f"Unsupported platform: {system} {machine}")
 
 
-def get_hidden_imports() -> list[str]:
-    """Get list of hidden imports required for PyInstaller."""
-    return [
-        # MCP
-        "mcp",
-        "mcp.server",
-        "mcp.server.stdio",
-        "mcp.server.streamable_http_manager",
-        "mcp.types",
-        # ASGI/HTTP
-        "starlette",
-        "starlette.applications",
-        "starlette.requests",
-        "starlette.responses",
-        "starlette.routing",
-        "uvicorn",
-        "uvicorn.config",
-        "uvicorn.server",
-        "uvicorn.lifespan",
-        "uvicorn.lifespan.on",
-        "uvicorn.protocols",
-        "uvicorn.protocols.http",
-        "uvicorn.protocols.http.auto",
-        "uvicorn.protocols.http.h11_impl",
-        "uvicorn.protocols.websockets",
-        "uvicorn.protocols.websockets.auto",
-        "uvicorn.loops",
-        "uvicorn.loops.auto",
-        # TastyTrade
-        "tastytrade",
-        "tastytrade.instruments",
-        "tastytrade.market_data",
-        "tastytrade.session",
-        "tastytrade.account",
-        # Qt/PySide6
-        "PySide6",
-        "PySide6.QtCore",
-        "PySide6.QtGui",
-        "PySide6.QtWidgets",
-        "PySide6.QtSvg",
-        "qasync",
-        # Cryptography
-        "cryptography",
-        "cryptography.fernet",
-        "cryptography.hazmat.primitives.kdf.pbkdf2",
-        # Database
-        "aiosqlite",
-        "sqlite3",
-        # HTTP client
-        "httpx",
-        "httpx._transports",
-        "httpx._transports.default",
-        # Pydantic
-        "pydantic",
-        "pydantic.fields",
-        "pydantic_core",
-        # Anyio (used by MCP)
-        "anyio",
-        "anyio._backends",
-        "anyio._backends._asyncio",
-        # SSE
-        "sse_starlette",
-        "sse_starlette.sse",
-        # JSON
-        "json",
-        # Logging
-        "logging.handlers",
-        # pyobjc for macOS integration
-        "objc",
-        "AppKit",
-        "Foundation",
-        "Cocoa",
-        "PyObjCTools",
+# Modules that are only ever imported dynamically (by string name), so static
+# analysis of our sources can't find them
+DYNAMIC_HIDDEN_IMPORTS = [
+    "uvicorn.lifespan.on",
+    "uvicorn.logging",
+    "uvicorn.loops.auto",
+    "uvicorn.protocols.http.auto",
+    "uvicorn.protocols.http.h11_impl",
+    "uvicorn.protocols.websockets.auto",
+    "anyio._backends._asyncio",
+]
+
+
+def _source_files() -> list[Path]:
+    """All Python source files of the app package."""
+    src_dir = Path(__file__).parent.parent / "src"
+    return sorted(src_dir.rglob("*.py"))
+
+
+@functools.cache
+def get_qt_modules() -> tuple[str, ...]:
+    """Find the PySide6 modules the app actually imports by scanning its sources.
+
+    Only these are collected; PyInstaller's PySide6 hooks then pull in just the
+    Qt libraries and plugins they need.
+    """
+    modules: set[str] = set()
+    for path in _source_files():
+        for node in ast.walk(ast.parse(path.read_bytes(), filename=str(path))):
+            if isinstance(node, ast.ImportFrom) and node.module:
+                names = [node.module]
+            elif isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            else:
+                continue
+            modules.update(name for name in names if name.startswith("PySide6."))
+    return tuple(sorted(modules))
+
+
+@functools.cache
+def get_hidden_imports() -> tuple[str, ...]:
+    """Get list of hidden imports required for PyInstaller.
+
+    Every module of the app package is listed (so lazily imported ones are never
+    missed), plus the third-party modules that are only imported dynamically.
+    Everything else is found by PyInstaller's own import analysis.
+    """
+    src_python_dir = Path(__file__).parent.parent
+    app_modules = [
+        ".".join(path.relative_to(src_python_dir).with_suffix("").parts).removesuffix(".__init__")
+        for path in _source_files()
     ]
+    return tuple(app_modules + DYNAMIC_HIDDEN_IMPORTS)
 
 
 def build() -> None:
@@ -315,6 +623,9 @@ def build() -> None:
     system = platform.system().lower()
     target_triple = get_target_triple()
 
+    # Validate settings up front rather than after a full PyInstaller run
+    archive_compression = get_archive_compression()
+
     # Determine paths
     src_python_dir = Path(__file__).parent.parent.resolve()
     entry_point = src_python_dir / "src" / "server" / "main.py"
@@ -329,154 +640,213 @@ def build() -> None:
     print(f"Building {APP_NAME} for {target_triple}...")
     print(f"Entry point: {entry_point}")
 
-    # Generate platform-specific icon
-    icon_path: Path | None = None
-    if icon_png.exists():
-        if system == "darwin":
-            icon_path = build_dir / "icon.icns"
-            build_dir.mkdir(parents=True, exist_ok=True)
-            if create_icns(icon_png, icon_path):
-                print(f"Created macOS icon: {icon_path}")
-            else:
-                icon_path = None
-        elif system == "windows":
-            icon_path = build_dir / "icon.ico"
-            build_dir.mkdir(parents=True, exist_ok=True)
-            if create_ico(icon_png, icon_path):
-                print(f"Created Windows icon: {icon_path}")
-            else:
-                icon_path = None
-
-    # Modules to exclude from the build
-    excluded_modules = [
-        # Large PySide6/Qt modules we don't need
-        "PySide6.QtWebEngine",
-        "PySide6.QtWebEngineCore",
-        "PySide6.QtWebEngineWidgets",
-        "PySide6.QtWebChannel",
-        "PySide6.Qt3DCore",
-        "PySide6.Qt3DRender",
-        "PySide6.Qt3DInput",
-        "PySide6.Qt3DLogic",
-        "PySide6.Qt3DAnimation",
-        "PySide6.Qt3DExtras",
-        "PySide6.QtMultimedia",
-        "PySide6.QtMultimediaWidgets",
-        "PySide6.QtQml",
-        "PySide6.QtQuick",
-        "PySide6.QtQuickWidgets",
-        "PySide6.QtQuickControls2",
-        "PySide6.QtBluetooth",
-        "PySide6.QtNfc",
-        "PySide6.QtPositioning",
-        "PySide6.QtLocation",
-        "PySide6.QtSensors",
-        "PySide6.QtSerialPort",
-        "PySide6.QtWebSockets",
-        "PySide6.QtPdf",
-        "PySide6.QtPdfWidgets",
-        "PySide6.QtCharts",
-        "PySide6.QtDataVisualization",
-        "PySide6.QtNetworkAuth",
-        "PySide6.QtRemoteObjects",
-        "PySide6.QtScxml",
-        "PySide6.QtSql",
-        "PySide6.QtTest",
-        "PySide6.QtXml",
-        "PySide6.QtDesigner",
-        "PySide6.QtHelp",
-        "PySide6.QtOpenGL",
-        "PySide6.QtOpenGLWidgets",
-        "PySide6.QtStateMachine",
-        "PySide6.QtUiTools",
-        "PySide6.QtSpatialAudio",
-        "PySide6.QtHttpServer",
-        "PySide6.QtVirtualKeyboard",
-        "PySide6.QtTextToSpeech",
-        "PySide6.QtSerialBus",
-        "PySide6.QtShaderTools",
-        # Dev tools that shouldn't be bundled
-        "mypy",
-        "pytest",
-        "ruff",
-        "black",
-        # Not needed at runtime
-        "PIL",
-        "pillow",
-        "numpy.testing",
-    ]
+    # Generate the platform icon in the background while the PyInstaller
+    # command is assembled (the source scans for Qt modules and hidden imports).
+    # Leaving the block, also on an error, shuts the icon worker down
+    with ThreadPoolExecutor(max_workers=1) as icon_executor:
+        icon_future = icon_executor.submit(create_icon, system, icon_png, build_dir)
+
+        prebake_tray_icons(resources_dir)
+
+        # Generate src/gui/resources_rc.py before the sources are scanned, so it is
+        # picked up as a hidden import
+        compile_qt_resources(
+            resources_dir / "resources.qrc",
+            src_python_dir / "src" / "gui" / "resources_rc.py",
+        )
+
+        # Modules to exclude from the build
+        excluded_modules = [
+            # Large PySide6/Qt modules we don't need
+            "PySide6.QtWebEngine",
+            "PySide6.QtWebEngineCore",
+            "PySide6.QtWebEngineWidgets",
+            "PySide6.QtWebChannel",
+            "PySide6.Qt3DCore",
+            "PySide6.Qt3DRender",
+            "PySide6.Qt3DInput",
+            "PySide6.Qt3DLogic",
+            "PySide6.Qt3DAnimation",
+            "PySide6.Qt3DExtras",
+            "PySide6.QtMultimedia",
+            "PySide6.QtMultimediaWidgets",
+            "PySide6.QtQml",
+            "PySide6.QtQuick",
+            "PySide6.QtQuickWidgets",
+            "PySide6.QtQuickControls2",
+            "PySide6.QtBluetooth",
+            "PySide6.QtNfc",
+            "PySide6.QtPositioning",
+            "PySide6.QtLocation",
+            "PySide6.QtSensors",
+            "PySide6.QtSerialPort",
+            "PySide6.QtWebSockets",
+            "PySide6.QtPdf",
+            "PySide6.QtPdfWidgets",
+            "PySide6.QtCharts",
+            "PySide6.QtDataVisualization",
+            "PySide6.QtNetworkAuth",
+            "PySide6.QtRemoteObjects",
+            "PySide6.QtScxml",
+            "PySide6.QtSql",
+            "PySide6.QtTest",
+            "PySide6.QtXml",
+            "PySide6.QtDesigner",
+            "PySide6.QtHelp",
+            "PySide6.QtOpenGL",
+            "PySide6.QtOpenGLWidgets",
+            "PySide6.QtStateMachine",
+            "PySide6.QtUiTools",
+            "PySide6.QtSpatialAudio",
+            "PySide6.QtHttpServer",
+            "PySide6.QtVirtualKeyboard",
+            "PySide6.QtTextToSpeech",
+            "PySide6.QtSerialBus",
+            "PySide6.QtShaderTools",
+            # Dev tools that shouldn't be bundled
+            "mypy",
+            "pytest",
+            "ruff",
+            "black",
+            # Not needed at runtime (Pillow is only used here, to build icons)
+            "PIL",
+            "pillow",
+            "numpy.testing",
+            # Stdlib/tooling pulled in transitively but never used by the app.
+            # unittest, pdb, pygments, setuptools and pydantic.v1 stay bundled:
+            # dependencies can import them lazily (unittest.mock, pydantic's v1
+            # re-exports), which would only fail at runtime in the frozen app
+            "tkinter",
+            "test",
+            "doctest",
+            "lib2to3",
+            "distutils",
+            "pip",
+            "IPython",
+        ]
 
-    # Base PyInstaller command
-    cmd = [
-        sys.executable, "-m", "PyInstaller",
-        "--name", APP_NAME,
-        "--distpath", str(dist_dir),
-        "--workpath", str(build_dir),
-        "--specpath", str(build_dir),
-        # Collect PySide6 but we'll exclude unused modules
-        "--collect-all", "PySide6",
-        # Add GUI resources
-        "--add-data", f"{resources_dir}{path_sep}src/gui/resources",
-        # Clean build
-        "--clean",
-        "--noconfirm",
-    ]
+        # Base PyInstaller command
+        cmd = [
+            sys.executable, "-m", "PyInstaller",
+            "--name", APP_NAME,
+            "--distpath", str(dist_dir),
+            "--workpath", str(build_dir),
+            "--specpath", str(build_dir),
+            # Add GUI resources
+            "--add-data", f"{resources_dir}{path_sep}src/gui/resources",
+            # Project hooks (trim Qt plugins/translations at collection time)
+            "--additional-hooks-dir", str(src_python_dir / "hooks"),
+            # Strip asserts and docstrings from the bundled bytecode (python -OO).
+            # Safe: MCP tool descriptions and CLI help are explicit strings, nothing
+            # reads __doc__ at runtime.
+            "--optimize", "2",
+            "--noconfirm",
+        ]
 
-    # Exclude large unused modules
-    for module in excluded_modules:
-        cmd.extend(["--exclude-module", module])
+        # Compress the onefile payload with UPX when available: less data to
+        # extract to the temp dir on every launch. macOS uses --onedir (no
+        # per-launch extraction) and UPX breaks code signing there, so skip it.
+        upx = shutil.which("upx")
+        if upx and system != "darwin":
+            cmd.extend(["--upx-dir", str(Path(upx).parent)])
+            for pattern in UPX_EXCLUDE:
+                cmd.extend(["--upx-exclude", pattern])
+        else:
+            cmd.append("--noupx")
 
-    # Add icon if available
-    if icon_path and icon_path.exists():
-        cmd.extend(["--icon", str(icon_path)])
+        # Strip symbol tables from bundled shared libraries. Not done on Windows
+        # (PyInstaller advises against it there) or macOS (invalidates signatures).
+        if system == "linux":
+            cmd.append("--strip")
 
-    # Platform-specific options
-    if system == "darwin":
-        # macOS: Create .app bundle
-        cmd.extend([
-            "--windowed",  # Creates .app bundle
-            "--onedir",    # Required for .app structure
-            # Collect pyobjc for macOS integration (tray, dock hiding)
-            "--collect-submodules", "objc",
-            "--collect-submodules", "AppKit",
-            "--collect-submodules", "Foundation",
-        ])
-        output_desc = f"{APP_NAME}.app bundle"
-    elif system == "windows":
-        # Windows: Single GUI executable
-        cmd.extend([
-            "--windowed",  # No console window on double-click
-            "--onefile",   # Single .exe file
-        ])
-        output_desc = f"{APP_NAME}.exe"
-    else:
-        # Linux: Single executable
-        cmd.extend([
-            "--onefile",
-        ])
-        output_desc = f"{APP_NAME} executable"
+        # Collect only the Qt modules we use
+        for module in get_qt_modules():
+            cmd.extend(["--collect-submodules", module])
+
+        # Exclude large unused modules
+        for module in excluded_modules:
+            cmd.extend(["--exclude-module", module])
 
-    # Add hidden imports
-    for imp in get_hidden_imports():
-        cmd.extend(["--hidden-import", imp])
+        # Platform-specific options
+        if system == "darwin":
+            # macOS: Create .app bundle
+            cmd.extend([
+                "--windowed",  # Creates .app bundle
+                "--onedir",    # Required for .app structure
+                # Collect pyobjc for macOS integration (tray, dock hiding)
+                "--collect-submodules", "objc",
+                "--collect-submodules", "AppKit",
+                "--collect-submodules", "Foundation",
+            ])
+            output_desc = f"{APP_NAME}.app bundle"
+        elif system == "windows":
+            # Windows: Single GUI executable
+            cmd.extend([
+                "--windowed",  # No console window on double-click
+                "--onefile",   # Single .exe file
+            ])
+            output_desc = f"{APP_NAME}.exe"
+        else:
+            # Linux: Single executable
+            cmd.extend([
+                "--onefile",
+            ])
+            output_desc = f"{APP_NAME} executable"
+
+        # Add hidden imports
+        for imp in get_hidden_imports():
+            cmd.extend(["--hidden-import", imp])
+
+        # Add icon if available
+        icon_path = icon_future.result()
+    if icon_path and icon_path.exists():
+        cmd.extend(["--icon", str(icon_path)])
 
     # Add entry point
     cmd.append(str(entry_point))
 
+    # Reuse PyInstaller's analysis cache unless the build inputs changed.
+    # TTAI_INCREMENTAL=1 always reuses it, TTAI_INCREMENTAL=0 always cleans.
+    cache_key_path = build_dir / ".cachekey"
+    cache_key = build_cache_key(cmd, src_python_dir / "uv.lock")
+    incremental = get_incremental_mode()
+    if incremental is None:
+        clean = not cache_key_path.exists() or cache_key_path.read_text() != cache_key
+        if clean:
+            print("Build inputs changed, doing a clean build")
+    else:
+        clean = not incremental
+    if clean:
+        cmd.insert(cmd.index("--noconfirm"), "--clean")
+
     print(f"Output: {output_desc}")
     print(f"\nRunning PyInstaller...")
 
-    # Run PyInstaller
-    result = subprocess.run(cmd, cwd=src_python_dir)
+    # Final artifact names (the PyInstaller output is renamed to include the triple)
+    if system == "darwin":
+        final_output = dist_dir / f"{APP_NAME}-{target_triple}.app"
+    elif system == "windows":
+        final_output = dist_dir / f"{APP_NAME}-{target_triple}.exe"
+    else:
+        final_output = dist_dir / f"{APP_NAME}-{target_triple}"
 
-    if result.returncode != 0:
-        print(f"\nBuild failed with exit code {result.returncode}")
-        sys.exit(result.returncode)
+    # Run PyInstaller, deleting the previous artifact while it analyzes
+    returncode = run_streaming(
+        cmd,
+        cwd=src_python_dir,
+        while_running=lambda: remove_path(final_output),
+    )
+
+    if returncode != 0:
+        cache_key_path.unlink(missing_ok=True)
+        print(f"\nBuild failed with exit code {returncode}")
+        sys.exit(returncode)
+
+    cache_key_path.write_text(cache_key)
 
     # Determine output path and create final artifact
     if system == "darwin":
         app_bundle = dist_dir / f"{APP_NAME}.app"
-        final_output = dist_dir / f"{APP_NAME}-{target_triple}.app"
 
         if app_bundle.exists():
             # Rename to include target triple
@@ -484,17 +854,17 @@ def build() -> None:
                 shutil.rmtree(final_output)
             app_bundle.rename(final_output)
 
-            # Clean up unnecessary Qt frameworks to reduce size
+            # Safety net for anything the Qt hooks still drag in (translations,
+            # dev tools); mostly a no-op now that PySide6 isn't collected wholesale
             print("\nCleaning up unnecessary files...")
             cleanup_bundle(final_output)
 
-            # Calculate and show final size
-            total_size = sum(f.stat().st_size for f in final_output.rglob("*") if f.is_file())
-            print(f"\nFinal app size: {total_size / 1024 / 1024:.1f} MB")
-
-            # Also create a zip for distribution
+            # Create a zip for distribution, measuring the bundle in the same pass
             zip_path = dist_dir / f"{APP_NAME}-{target_triple}"
-            shutil.make_archive(str(zip_path), "zip", dist_dir, f"{APP_NAME}-{target_triple}.app")
+            total_size = make_zip(
+                Path(f"{zip_path}.zip"), dist_dir, final_output.name, archive_compression
+            )
+            print(f"\nFinal app size: {total_size / 1024 / 1024:.1f} MB")
 
             print(f"\nBuild successful!")
             print(f"App bundle: {final_output}")
@@ -506,7 +876,6 @@ def build() -> None:
 
     elif system == "windows":
         exe_path = dist_dir / f"{APP_NAME}.exe"
-        final_output = dist_dir / f"{APP_NAME}-{target_triple}.exe"
 
         if exe_path.exists():
             if final_output.exists():
@@ -523,7 +892,6 @@ def build() -> None:
 
     else:  # Linux
         exe_path = dist_dir / APP_NAME
-        final_output = dist_dir / f"{APP_NAME}-{target_triple}"
 
         if exe_path.exists():
             if final_output.exists():
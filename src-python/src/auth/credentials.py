@@ -1,9 +1,11 @@
 """Credential management with Fernet encryption."""
 
+import functools
 import json
 import logging
 import os
 import stat
+import struct
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -11,6 +13,96 @@ from cryptography.fernet import Fernet
 
 logger = logging.getLogger("ttai.auth")
 
+# Credential blob layout: version byte, then one big-endian u32 length per
+# field, then the UTF-8 field values in _FIELDS order. Older versions stored a
+# JSON object, which is still accepted on read.
+_FORMAT_VERSION = 1
+_FIELDS = ("client_secret", "refresh_token")
+_LENGTHS = struct.Struct(f">{len(_FIELDS)}I")
+
+
+def _pack(data: dict[str, str]) -> bytes:
+    """Serialize credential fields into the binary frame."""
+    values = [data[field].encode() for field in _FIELDS]
+    return bytes([_FORMAT_VERSION]) + _LENGTHS.pack(*map(len, values)) + b"".join(values)
+
+
+def _unpack(blob: bytes) -> dict[str, str]:
+    """Deserialize a binary frame (or a legacy JSON blob) into credential fields."""
+    if blob[:1] == b"{":
+        return json.loads(blob.decode())
+    if blob[0] != _FORMAT_VERSION:
+        raise ValueError(f"Unsupported credentials format version {blob[0]}")
+
+    data = {}
+    offset = 1 + _LENGTHS.size
+    for field, length in zip(_FIELDS, _LENGTHS.unpack_from(blob, 1)):
+        data[field] = blob[offset : offset + length].decode()
+        offset += length
+    return data
+
+
+def _write_private(path: Path, data: bytes) -> None:
+    """Write a file readable only by the owner.
+
+    The 0o600 mode is applied when the file is created, so there is no window
+    where the secret sits on disk with umask-default permissions, and is
+    re-applied to files that already existed with looser permissions.
+
+    Args:
+        path: File to write
+        data: Contents to write
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    mode = stat.S_IRUSR | stat.S_IWUSR  # 0o600
+    fd = os.open(path, flags, mode)
+    with os.fdopen(fd, "wb") as f:
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, mode)
+        f.write(data)
+
+
+def _fernet_for(data_dir: Path) -> Fernet:
+    """Get the Fernet instance for a data directory, creating its key if needed.
+
+    The key file is parsed once per version of the file, so every
+    CredentialManager for the same data dir shares one instance; replacing or
+    deleting the key file is picked up on the next call.
+
+    Args:
+        data_dir: Directory holding the key file
+
+    Returns:
+        Fernet instance for encryption/decryption
+    """
+    key_path = data_dir / ".key"
+
+    try:
+        st = key_path.stat()
+    except FileNotFoundError:
+        data_dir.mkdir(parents=True, exist_ok=True)
+        key = Fernet.generate_key()
+        _write_private(key_path, key)
+        logger.info(f"Generated new encryption key at {key_path}")
+        return Fernet(key)
+
+    return _load_fernet(key_path, st.st_ino, st.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_fernet(key_path: Path, ino: int, mtime_ns: int) -> Fernet:
+    """Read a key file into a Fernet instance.
+
+    Args:
+        key_path: Key file to read
+        ino: Inode of the key file, part of the cache key only
+        mtime_ns: Modification time of the key file, part of the cache key only
+
+    Returns:
+        Fernet instance for encryption/decryption
+    """
+    return Fernet(key_path.read_bytes())
+
 
 @dataclass
 class Credentials:
@@ -30,41 +122,37 @@ class CredentialManager:
             data_dir: Directory to store credentials and key files
         """
         self._data_dir = data_dir
-        self._key_path = data_dir / ".key"
         self._credentials_path = data_dir / ".credentials"
-        self._fernet: Fernet | None = None
 
     def _ensure_data_dir(self) -> None:
         """Ensure the data directory exists with proper permissions."""
         self._data_dir.mkdir(parents=True, exist_ok=True)
 
-    def _get_or_create_key(self) -> bytes:
-        """Get existing key or generate a new one.
+    def _get_fernet(self) -> Fernet:
+        """Get the Fernet instance shared by all managers for this data dir.
 
         Returns:
-            The encryption key bytes
+            Fernet instance for encryption/decryption
         """
-        self._ensure_data_dir()
+        return _fernet_for(self._data_dir)
 
-        if self._key_path.exists():
-            return self._key_path.read_bytes()
+    def _read_raw(self) -> dict[str, str]:
+        """Read and decrypt the stored credentials blob.
 
-        key = Fernet.generate_key()
-        self._key_path.write_bytes(key)
-        os.chmod(self._key_path, stat.S_IRUSR | stat.S_IWUSR)  # 0o600
-        logger.info(f"Generated new encryption key at {self._key_path}")
-        return key
+        Returns:
+            The decrypted credential fields
+        """
+        return _unpack(self._get_fernet().decrypt(self._credentials_path.read_bytes()))
 
-    def _get_fernet(self) -> Fernet:
-        """Get or create the Fernet instance.
+    def _write_raw(self, data: dict[str, str]) -> None:
+        """Encrypt and write the credentials blob.
 
-        Returns:
-            Fernet instance for encryption/decryption
+        Args:
+            data: Credential fields to store
         """
-        if self._fernet is None:
-            key = self._get_or_create_key()
-            self._fernet = Fernet(key)
-        return self._fernet
+        self._ensure_data_dir()
+        encrypted = self._get_fernet().encrypt(_pack(data))
+        _write_private(self._credentials_path, encrypted)
 
     def store_credentials(
         self,
@@ -77,16 +165,12 @@ class CredentialManager:
             client_secret: TastyTrade OAuth client secret
             refresh_token: TastyTrade OAuth refresh token
         """
-        self._ensure_data_dir()
-        fernet = self._get_fernet()
-
-        data = {
-            "client_secret": client_secret,
-            "refresh_token": refresh_token,
-        }
-        encrypted = fernet.encrypt(json.dumps(data).encode())
-        self._credentials_path.write_bytes(encrypted)
-        os.chmod(self._credentials_path, stat.S_IRUSR | stat.S_IWUSR)  # 0o600
+        self._write_raw(
+            {
+                "client_secret": client_secret,
+                "refresh_token": refresh_token,
+            }
+        )
         logger.info("Credentials stored successfully")
 
     def load_credentials(self) -> Credentials | None:
@@ -95,18 +179,15 @@ class CredentialManager:
         Returns:
             Credentials if found, None otherwise
         """
-        if not self._credentials_path.exists():
-            return None
-
         try:
-            fernet = self._get_fernet()
-            encrypted = self._credentials_path.read_bytes()
-            decrypted = fernet.decrypt(encrypted)
-            data = json.loads(decrypted.decode())
+            data = self._read_raw()
             return Credentials(
                 client_secret=data["client_secret"],
                 refresh_token=data["refresh_token"],
             )
+        except FileNotFoundError:
+            # Single open instead of exists() + read: missing means not stored
+            return None
         except Exception as e:
             logger.error(f"Failed to load credentials: {e}")
             return None
@@ -1,31 +1,39 @@
 """TTAI PySide6 application with asyncio integration."""
 
 import asyncio
+import functools
+import importlib
 import logging
 import signal
 import sys
+from collections.abc import Coroutine
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from PySide6.QtCore import QTimer
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication
 from qasync import QEventLoop
 
-from src.auth.credentials import CredentialManager
 from src.gui.main_window import MainWindow
-from src.gui.preferences import PreferencesManager
 from src.gui.state import AppState
 from src.gui.system_tray import SystemTrayManager
-from src.server.config import ServerConfig
-from src.services.cache import CacheService
-from src.services.tastytrade import TastyTradeService
 
 if TYPE_CHECKING:
     from mcp.server import Server
 
+    from src.auth.credentials import Credentials
+    from src.server.config import ServerConfig
+    from src.services.tastytrade import TastyTradeService
+
 logger = logging.getLogger("ttai.gui")
 
+# Seconds cancelled tasks get to unwind on shutdown
+SHUTDOWN_TIMEOUT = 2.0
+
 
+@functools.cache
 def _get_resources_dir() -> Path:
     """Get resources directory, handling PyInstaller frozen apps."""
     if getattr(sys, "frozen", False):
@@ -38,7 +46,7 @@ class TTAIApplication:
 
     def __init__(
         self,
-        config: ServerConfig,
+        config: "ServerConfig",
         mcp_server: "Server | None" = None,
         tastytrade_service: "TastyTradeService | None" = None,
     ) -> None:
@@ -52,8 +60,14 @@ class TTAIApplication:
         self.config = config
         self.mcp_server = mcp_server
         self._server_task: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._restore_scheduled = False
         self._shutting_down = False
 
+        # Small dedicated pool for credential file I/O and Fernet crypto, so it
+        # never runs on the Qt/asyncio thread or queues behind other work
+        self._crypto_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ttai-crypto")
+
         # Initialize Qt application
         self.app = QApplication(sys.argv)
         self.app.setApplicationName("TTAI")
@@ -72,11 +86,25 @@ class TTAIApplication:
         self.loop = QEventLoop(self.app)
         asyncio.set_event_loop(self.loop)
 
+        # The server module (uvicorn, starlette, ssl) is needed as soon as the
+        # MCP server starts; import it on a worker thread while the window is
+        # built (instant when the caller has already loaded it)
+        self._server_module: asyncio.Future | None = None
+        if mcp_server is not None:
+            self._server_module = self.loop.run_in_executor(
+                None, importlib.import_module, "src.server.main"
+            )
+
         # Use shared service if provided, otherwise create new
         if tastytrade_service is not None:
             self.tastytrade_service = tastytrade_service
             self.credential_manager = tastytrade_service._credential_manager
         else:
+            # Only needed when running without a shared service (no MCP server)
+            from src.auth.credentials import CredentialManager
+            from src.services.cache import CacheService
+            from src.services.tastytrade import TastyTradeService
+
             self.credential_manager = CredentialManager(config.data_dir)
             self.cache_service = CacheService()
             self.tastytrade_service = TastyTradeService(self.credential_manager, self.cache_service)
@@ -85,6 +113,8 @@ class TTAIApplication:
         self.state = AppState()
 
         # Initialize preferences manager (must be after QApplication setup)
+        from src.gui.preferences import PreferencesManager
+
         self.preferences = PreferencesManager()
 
         # Initialize main window
@@ -113,24 +143,25 @@ class TTAIApplication:
         # Show system tray icon
         self.tray_manager.show()
 
-        # Show window based on preference (always show on first run)
+        # Show window based on preference (always show on first run). Session
+        # restore (credential decrypt + HTTPS) waits until the window has
+        # painted, or until the event loop is running if it stays hidden
         if self.preferences.show_window_on_launch:
+            self.main_window.first_shown.connect(self._schedule_restore)
             self.main_window.show()
+        else:
+            QTimer.singleShot(0, self._schedule_restore)
 
         # Mark first run complete
         if self.preferences.is_first_run:
             self.preferences.mark_first_run_complete()
 
-        # Schedule session restore
-        asyncio.ensure_future(self._restore_session())
-
         # Start MCP server if provided
         if self.mcp_server is not None:
-            self._server_task = asyncio.ensure_future(self._run_mcp_server())
+            self._server_task = self._track(self._run_mcp_server())
 
         # Handle Ctrl+C gracefully
-        for sig in (signal.SIGINT, signal.SIGTERM):
-            self.loop.add_signal_handler(sig, self._handle_signal)
+        self._install_signal_handlers()
 
         # Run the event loop
         with self.loop:
@@ -139,6 +170,23 @@ class TTAIApplication:
             finally:
                 self._cleanup()
 
+    def _install_signal_handlers(self) -> None:
+        """Route SIGINT/SIGTERM to a graceful shutdown."""
+        if sys.platform != "win32":
+            # Delivered through the loop's self-pipe, no polling needed
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                self.loop.add_signal_handler(sig, self._handle_signal)
+            return
+
+        # Windows event loops don't support add_signal_handler. Python only
+        # runs signal handlers when the interpreter gets control, which
+        # doesn't happen while Qt blocks in its native event loop, so wake it
+        # periodically.
+        signal.signal(signal.SIGINT, lambda *_: self._handle_signal())
+        self._signal_timer = QTimer(self.app)
+        self._signal_timer.timeout.connect(lambda: None)
+        self._signal_timer.start(200)
+
     def _hide_from_dock(self) -> None:
         """Hide the application from the dock (macOS only)."""
         if sys.platform != "darwin":
@@ -176,46 +224,100 @@ class TTAIApplication:
         if self._server_task and not self._server_task.done():
             self._server_task.cancel()
 
+    def _schedule_restore(self) -> None:
+        """Start the session restore, at most once."""
+        if self._restore_scheduled:
+            return
+        self._restore_scheduled = True
+        self._track(self._restore_session())
+
+    def _track(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        """Schedule a coroutine as a task owned by the application.
+
+        Args:
+            coro: Coroutine to run on the event loop
+
+        Returns:
+            The scheduled task
+        """
+        task = asyncio.ensure_future(coro)
+        # Strong reference until done: the loop itself only keeps weak ones
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
     def _cleanup(self) -> None:
         """Clean up resources on shutdown."""
-        # Cancel any pending tasks
-        for task in asyncio.all_tasks(self.loop):
-            if not task.done():
-                task.cancel()
+        # Cancel the tasks we started that are still pending, and let them
+        # unwind (close sockets, run finally blocks) before the loop closes
+        pending = [task for task in self._tasks if not task.done()]
+        if pending:
+            # Cancelling the gather cancels every child in one call
+            gathered = asyncio.gather(*pending, return_exceptions=True)
+            gathered.cancel()
+            try:
+                self.loop.run_until_complete(asyncio.wait_for(gathered, SHUTDOWN_TIMEOUT))
+            except asyncio.CancelledError:
+                # Expected: the cancelled gather resolves as cancelled once
+                # all of its children have finished
+                pass
+            except TimeoutError:
+                logger.warning("Timed out waiting for tasks to finish")
+            except Exception as e:
+                logger.warning(f"Error waiting for tasks to finish: {e}")
+
+        self._crypto_pool.shutdown(wait=False, cancel_futures=True)
 
     async def _run_mcp_server(self) -> None:
         """Run the MCP server in the background."""
-        from src.server.main import _run_http_with_ssl
-
         logger.info("Starting MCP server in background...")
         try:
-            await _run_http_with_ssl(self.mcp_server, self.config)
+            if self._server_module is not None:
+                server_module = await self._server_module
+            else:
+                server_module = importlib.import_module("src.server.main")
+            await server_module._run_http_with_ssl(self.mcp_server, self.config)
         except asyncio.CancelledError:
             logger.info("MCP server stopped")
         except Exception as e:
             if not self._shutting_down:
                 logger.error(f"MCP server error: {e}")
 
+    async def _load_credentials(self) -> "Credentials | None":
+        """Load and decrypt stored credentials on the crypto pool.
+
+        Returns:
+            Credentials if found, None otherwise
+        """
+        return await self.loop.run_in_executor(
+            self._crypto_pool, self.credential_manager.load_credentials
+        )
+
     async def _restore_session(self) -> None:
         """Attempt to restore session from stored credentials."""
-        if self.credential_manager.has_credentials():
-            logger.info("Attempting to restore session from stored credentials")
-            self.state.is_logging_in = True
-            try:
-                success = await self.tastytrade_service.restore_session()
-                if success:
-                    logger.info("Session restored successfully")
-                else:
-                    logger.warning("Failed to restore session")
-            except Exception as e:
-                logger.error(f"Error restoring session: {e}")
-            finally:
-                self.state.is_logging_in = False
-                self.state.update_from_auth_status(self.tastytrade_service.get_auth_status())
+        # Load once here and hand the result to the service, so the file is
+        # only read (and decrypted) a single time
+        credentials = await self._load_credentials()
+        if credentials is None:
+            return
+
+        logger.info("Attempting to restore session from stored credentials")
+        self.state.is_logging_in = True
+        try:
+            success = await self.tastytrade_service.restore_session(credentials)
+            if success:
+                logger.info("Session restored successfully")
+            else:
+                logger.warning("Failed to restore session")
+        except Exception as e:
+            logger.error(f"Error restoring session: {e}")
+        finally:
+            self.state.is_logging_in = False
+            self.state.update_from_auth_status(self.tastytrade_service.get_auth_status())
 
 
 def run_gui(
-    config: ServerConfig,
+    config: "ServerConfig",
     mcp_server: "Server | None" = None,
     tastytrade_service: "TastyTradeService | None" = None,
 ) -> int:
@@ -1,32 +1,31 @@
 """Main application window."""
 
+import functools
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from PySide6.QtCore import QByteArray, Qt
-from PySide6.QtGui import QCloseEvent, QIcon, QPalette, QPixmap
-from PySide6.QtSvg import QSvgRenderer
-from PySide6.QtWidgets import (
-    QButtonGroup,
-    QHBoxLayout,
-    QMainWindow,
-    QSizePolicy,
-    QStackedWidget,
-    QToolBar,
-    QToolButton,
-    QWidget,
-)
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import QMainWindow
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from PySide6.QtCore import QEvent
+    from PySide6.QtGui import QCloseEvent, QIcon, QPalette, QPixmap, QShowEvent
+    from PySide6.QtSvg import QSvgRenderer
+    from PySide6.QtWidgets import QToolButton
 
-from src.auth.credentials import CredentialManager
-from src.gui.preferences import PreferencesManager
-from src.gui.state import AppState
-from src.gui.widgets.about_page import AboutPage
-from src.gui.widgets.connection_page import ConnectionPage
-from src.gui.widgets.settings_page import SettingsPage
-from src.server.config import ServerConfig
-from src.services.tastytrade import TastyTradeService
+    from src.auth.credentials import CredentialManager
+    from src.gui.preferences import PreferencesManager
+    from src.gui.state import AppState
+    from src.gui.widgets.about_page import AboutPage
+    from src.gui.widgets.settings_page import SettingsPage
+    from src.server.config import ServerConfig
+    from src.services.tastytrade import TastyTradeService
 
 
+@functools.cache
 def _get_resources_dir() -> Path:
     """Get resources directory, handling PyInstaller frozen apps."""
     if getattr(sys, "frozen", False):
@@ -37,42 +36,114 @@ def _get_resources_dir() -> Path:
 
 RESOURCES_DIR = _get_resources_dir()
 
+try:
+    # Compiled Qt resources (generated by scripts/build.py); registering them
+    # lets icons load from memory instead of from files on disk
+    from src.gui import resources_rc  # noqa: F401
+
+    _HAS_QT_RESOURCES = True
+except ImportError:
+    _HAS_QT_RESOURCES = False
+
 
-def _load_themed_icon(svg_path: Path, palette: QPalette) -> QIcon:
-    """Load an SVG icon with currentColor replaced by the palette text color."""
-    text_color = palette.color(QPalette.ColorRole.WindowText).name()
+def _icon_path(name: str) -> str:
+    """Get the path of a bundled icon, preferring the compiled Qt resources."""
+    if _HAS_QT_RESOURCES:
+        return f":/ttai/{name}"
+    return str(RESOURCES_DIR / name)
 
-    svg_content = svg_path.read_text()
-    svg_content = svg_content.replace("currentColor", text_color)
 
-    # Render SVG to pixmap
-    svg_data = QByteArray(svg_content.encode())
-    renderer = QSvgRenderer(svg_data)
+@functools.lru_cache(maxsize=16)
+def _svg_renderer(svg_path: str) -> "QSvgRenderer":
+    """Parse an SVG once; the result is shared by every size and theme."""
+    from PySide6.QtSvg import QSvgRenderer
 
-    pixmap = QPixmap(24, 24)
+    # QSvgRenderer reads both ":/" resource paths and regular files
+    renderer = QSvgRenderer(svg_path)
+    if not renderer.isValid():
+        raise FileNotFoundError(svg_path)
+    return renderer
+
+
+@functools.lru_cache(maxsize=16)
+def _base_pixmap(svg_path: str, size: int) -> "QPixmap":
+    """Rasterize an SVG once per size, in its own (untinted) colors."""
+    from PySide6.QtGui import QPainter, QPixmap
+
+    pixmap = QPixmap(size, size)
     pixmap.fill(Qt.GlobalColor.transparent)
 
-    from PySide6.QtGui import QPainter
+    painter = QPainter(pixmap)
+    _svg_renderer(svg_path).render(painter)
+    painter.end()
+
+    return pixmap
+
+
+@functools.lru_cache(maxsize=32)
+def _themed_icon_cached(svg_path: str, text_color: str, size: int) -> "QIcon":
+    """Tint the rasterized SVG with a color, keeping only its alpha mask."""
+    from PySide6.QtGui import QColor, QIcon, QPainter
+
+    pixmap = _base_pixmap(svg_path, size).copy()
 
     painter = QPainter(pixmap)
-    renderer.render(painter)
+    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+    painter.fillRect(pixmap.rect(), QColor(text_color))
     painter.end()
 
     return QIcon(pixmap)
 
 
+def _clear_icon_cache() -> None:
+    """Drop tinted icons, e.g. after a theme change (parsed SVGs are kept)."""
+    _themed_icon_cached.cache_clear()
+
+
+def _text_color(palette: "QPalette") -> str:
+    """Get the window text color of a palette as a hex string."""
+    from PySide6.QtGui import QPalette
+
+    return palette.color(QPalette.ColorRole.WindowText).name()
+
+
+def _load_themed_icon(name: str, text_color: str, size: int = 24) -> "QIcon":
+    """Load a bundled monochrome SVG icon tinted with the given text color."""
+    return _themed_icon_cached(_icon_path(name), text_color, size)
+
+
+# On Windows/Linux, use Tool window flag to hide from taskbar
+# macOS uses a different approach (NSApplicationActivationPolicyAccessory)
+_WINDOW_FLAGS = Qt.WindowType.Window | Qt.WindowType.Tool
+
+# Toolbar tabs in stack order: (key, label, icon)
+TABS = (
+    ("connection", "Connection", "plug.svg"),
+    ("settings", "Settings", "settings.svg"),
+    ("about", "About", "info.svg"),
+)
+
+
 class MainWindow(QMainWindow):
     """Main application window with unified title bar and tabs."""
 
+    # Emitted once, after the window has been shown for the first time
+    first_shown = Signal()
+
     def __init__(
         self,
-        state: AppState,
-        tastytrade_service: TastyTradeService,
-        credential_manager: CredentialManager,
-        config: ServerConfig,
-        preferences: PreferencesManager | None = None,
+        state: "AppState",
+        tastytrade_service: "TastyTradeService",
+        credential_manager: "CredentialManager",
+        config: "ServerConfig",
+        preferences: "PreferencesManager | None" = None,
     ) -> None:
         """Initialize the main window."""
+        # Tab buttons by key; empty until _setup_toolbar, which can be after
+        # the first changeEvent
+        self._tab_buttons: dict[str, QToolButton] = {}
+        # The same buttons in TABS (and content stack) order, for _select_tab
+        self._tab_button_order: list[QToolButton] = []
         super().__init__()
         self.state = state
         self.tastytrade_service = tastytrade_service
@@ -82,6 +153,7 @@ class MainWindow(QMainWindow):
 
         # Flag for force quit (actual exit vs hide to tray)
         self._force_quit = False
+        self._was_shown = False
 
         self._setup_window()
         self._setup_toolbar()
@@ -93,16 +165,23 @@ class MainWindow(QMainWindow):
         # Fixed size, non-resizable
         self.setFixedSize(620, 400)
 
-        # On Windows/Linux, use Tool window flag to hide from taskbar
-        # macOS uses a different approach (NSApplicationActivationPolicyAccessory)
-        if sys.platform != "darwin":
-            self.setWindowFlags(Qt.WindowType.Window | Qt.WindowType.Tool)
-
-        # Unified title bar on macOS
-        self.setUnifiedTitleAndToolBarOnMac(True)
+        if sys.platform == "darwin":
+            # Unified title bar on macOS
+            self.setUnifiedTitleAndToolBarOnMac(True)
+        else:
+            self.setWindowFlags(_WINDOW_FLAGS)
 
     def _setup_toolbar(self) -> None:
         """Set up the toolbar with centered tab-style buttons."""
+        from PySide6.QtWidgets import (
+            QButtonGroup,
+            QHBoxLayout,
+            QSizePolicy,
+            QToolBar,
+            QToolButton,
+            QWidget,
+        )
+
         toolbar = QToolBar()
         toolbar.setMovable(False)
         toolbar.setFloatable(False)
@@ -125,45 +204,18 @@ class MainWindow(QMainWindow):
         # Fixed width for consistent tab sizing
         tab_width = 80
 
-        # Load icons with system text color
-        palette = self.palette()
-        connection_icon = _load_themed_icon(RESOURCES_DIR / "plug.svg", palette)
-        settings_icon = _load_themed_icon(RESOURCES_DIR / "settings.svg", palette)
-        about_icon = _load_themed_icon(RESOURCES_DIR / "info.svg", palette)
-
-        # Connection button
-        self.connection_btn = QToolButton()
-        self.connection_btn.setText("Connection")
-        self.connection_btn.setIcon(connection_icon)
-        self.connection_btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextUnderIcon)
-        self.connection_btn.setCheckable(True)
-        self.connection_btn.setChecked(True)
-        self.connection_btn.setAutoRaise(True)
-        self.connection_btn.setFixedWidth(tab_width)
-        self.tab_group.addButton(self.connection_btn, 0)
-        tab_layout.addWidget(self.connection_btn)
-
-        # Settings button
-        self.settings_btn = QToolButton()
-        self.settings_btn.setText("Settings")
-        self.settings_btn.setIcon(settings_icon)
-        self.settings_btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextUnderIcon)
-        self.settings_btn.setCheckable(True)
-        self.settings_btn.setAutoRaise(True)
-        self.settings_btn.setFixedWidth(tab_width)
-        self.tab_group.addButton(self.settings_btn, 1)
-        tab_layout.addWidget(self.settings_btn)
-
-        # About button
-        self.about_btn = QToolButton()
-        self.about_btn.setText("About")
-        self.about_btn.setIcon(about_icon)
-        self.about_btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextUnderIcon)
-        self.about_btn.setCheckable(True)
-        self.about_btn.setAutoRaise(True)
-        self.about_btn.setFixedWidth(tab_width)
-        self.tab_group.addButton(self.about_btn, 2)
-        tab_layout.addWidget(self.about_btn)
+        for index, (key, label, _icon) in enumerate(TABS):
+            button = QToolButton()
+            button.setText(label)
+            button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextUnderIcon)
+            button.setCheckable(True)
+            button.setChecked(index == 0)
+            button.setAutoRaise(True)
+            button.setFixedWidth(tab_width)
+            self.tab_group.addButton(button, index)
+            tab_layout.addWidget(button)
+            self._tab_buttons[key] = button
+            self._tab_button_order.append(button)
 
         self.tab_group.idClicked.connect(self._on_tab_changed)
         toolbar.addWidget(tab_container)
@@ -174,9 +226,25 @@ class MainWindow(QMainWindow):
         toolbar.addWidget(right_spacer)
 
         self.addToolBar(toolbar)
+        self._apply_tab_icons()
+
+    def _apply_tab_icons(self) -> None:
+        """Set tab icons tinted with the current system text color."""
+        text_color = _text_color(self.palette())
+        for key, _label, icon in TABS:
+            self._tab_buttons[key].setIcon(_load_themed_icon(icon, text_color))
 
     def _setup_ui(self) -> None:
-        """Set up the user interface."""
+        """Set up the user interface.
+
+        Only the initially visible connection page is built here; the other
+        pages start as empty placeholders and are built on first use, or
+        shortly after the window is first shown.
+        """
+        from PySide6.QtWidgets import QStackedWidget, QWidget
+
+        from src.gui.widgets.connection_page import ConnectionPage
+
         # Content stack
         self.content_stack = QStackedWidget()
         self.setCentralWidget(self.content_stack)
@@ -190,29 +258,80 @@ class MainWindow(QMainWindow):
         )
         self.content_stack.addWidget(self.connection_page)
 
-        # Settings page
+        # Settings and About pages, built lazily by _ensure_page
+        self.settings_page: SettingsPage | None = None
+        self.about_page: AboutPage | None = None
+        self._page_factories: dict[int, Callable[[], QWidget]] = {
+            1: self._create_settings_page,
+            2: self._create_about_page,
+        }
+        for _ in self._page_factories:
+            self.content_stack.addWidget(QWidget())
+
+    def _create_settings_page(self) -> "SettingsPage":
+        """Build the settings page and keep it as self.settings_page."""
+        from src.gui.widgets.settings_page import SettingsPage
+
         self.settings_page = SettingsPage(preferences=self.preferences)
-        self.content_stack.addWidget(self.settings_page)
+        return self.settings_page
+
+    def _create_about_page(self) -> "AboutPage":
+        """Build the about page and keep it as self.about_page."""
+        from src.gui.widgets.about_page import AboutPage
 
-        # About page
         self.about_page = AboutPage()
-        self.content_stack.addWidget(self.about_page)
+        return self.about_page
+
+    def _ensure_page(self, index: int) -> None:
+        """Replace a placeholder in the content stack with its real page."""
+        factory = self._page_factories.pop(index, None)
+        if factory is None:
+            return
+        page = factory()
+        placeholder = self.content_stack.widget(index)
+        self.content_stack.insertWidget(index, page)
+        self.content_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+
+    def _build_pending_pages(self) -> None:
+        """Build any pages that have not been opened yet."""
+        for index in list(self._page_factories):
+            self._ensure_page(index)
 
     def _on_tab_changed(self, index: int) -> None:
         """Handle tab selection change."""
+        self._ensure_page(index)
         self.content_stack.setCurrentIndex(index)
 
     def _select_tab(self, index: int) -> None:
         """Programmatically select a tab."""
-        if index == 0:
-            self.connection_btn.setChecked(True)
-        elif index == 1:
-            self.settings_btn.setChecked(True)
-        else:
-            self.about_btn.setChecked(True)
+        self._tab_button_order[index].setChecked(True)
+        self._ensure_page(index)
         self.content_stack.setCurrentIndex(index)
 
-    def closeEvent(self, event: QCloseEvent) -> None:  # noqa: N802 - Qt override
+    def changeEvent(self, event: "QEvent") -> None:  # noqa: N802 - Qt override
+        """Re-tint tab icons when the system palette changes."""
+        from PySide6.QtCore import QEvent
+
+        # Nothing to re-tint until the toolbar has been built
+        if event.type() == QEvent.Type.PaletteChange and self._tab_buttons:
+            _clear_icon_cache()
+            self._apply_tab_icons()
+        super().changeEvent(event)
+
+    def showEvent(self, event: "QShowEvent") -> None:  # noqa: N802 - Qt override
+        """Announce the first show once the window has had a chance to paint."""
+        super().showEvent(event)
+        if not self._was_shown:
+            from PySide6.QtCore import QTimer
+
+            self._was_shown = True
+            # Zero-delay timer: runs after the pending paint events are handled
+            QTimer.singleShot(0, self.first_shown.emit)
+            # Then build the hidden pages while the user is looking at the first
+            QTimer.singleShot(250, self._build_pending_pages)
+
+    def closeEvent(self, event: "QCloseEvent") -> None:  # noqa: N802 - Qt override
         """Handle window close event.
 
         Instead of quitting, hide the window to the system tray.
@@ -23,6 +23,19 @@ class PreferencesManager:
         set on QApplication, so ensure those are set before creating this.
         """
         self._settings = QSettings()
+        self._load()
+
+    def _load(self) -> None:
+        """Read the cached values from QSettings."""
+        self._is_first_run: bool = self._settings.value(self.KEY_IS_FIRST_RUN, True, type=bool)
+        self._show_window_on_launch: bool = self._settings.value(
+            self.KEY_SHOW_WINDOW_ON_LAUNCH, True, type=bool
+        )
+
+    def invalidate(self) -> None:
+        """Re-read cached values, e.g. after QSettings was written elsewhere."""
+        self._settings.sync()
+        self._load()
 
     @property
     def show_window_on_launch(self) -> bool:
@@ -30,23 +43,23 @@ class PreferencesManager:
 
         Defaults to True for first run, then remembers user preference.
         """
-        if self.is_first_run:
-            return True
-        return self._settings.value(self.KEY_SHOW_WINDOW_ON_LAUNCH, True, type=bool)
+        return self._is_first_run or self._show_window_on_launch
 
     @show_window_on_launch.setter
     def show_window_on_launch(self, value: bool) -> None:
         """Set whether to show the settings window on launch."""
         self._settings.setValue(self.KEY_SHOW_WINDOW_ON_LAUNCH, value)
+        self._show_window_on_launch = value
 
     @property
     def is_first_run(self) -> bool:
         """Whether this is the first time the app has been run."""
-        return self._settings.value(self.KEY_IS_FIRST_RUN, True, type=bool)
+        return self._is_first_run
 
     def mark_first_run_complete(self) -> None:
         """Mark that the first run is complete."""
         self._settings.setValue(self.KEY_IS_FIRST_RUN, False)
+        self._is_first_run = False
 
     def sync(self) -> None:
         """Force sync settings to disk."""
@@ -1,6 +1,8 @@
 """Reactive application state using Qt signals."""
 
-from PySide6.QtCore import QObject, Signal
+from typing import Any
+
+from PySide6.QtCore import QObject, Signal, Slot
 
 
 class AppState(QObject):
@@ -11,6 +13,14 @@ class AppState(QObject):
     is_logging_in_changed = Signal(bool)
     login_error_changed = Signal(str)
 
+    # State key -> (name of its change signal, value emitted for None)
+    _SIGNALS = {
+        "authenticated": ("authenticated_changed", False),
+        "has_stored_credentials": ("has_stored_credentials_changed", False),
+        "is_logging_in": ("is_logging_in_changed", False),
+        "login_error": ("login_error_changed", ""),
+    }
+
     def __init__(self, parent: QObject | None = None) -> None:
         """Initialize application state.
 
@@ -18,64 +28,91 @@ class AppState(QObject):
             parent: Optional parent QObject
         """
         super().__init__(parent)
-        self._authenticated = False
-        self._has_stored_credentials = False
-        self._is_logging_in = False
-        self._login_error: str | None = None
+        self._values: dict[str, Any] = {
+            "authenticated": False,
+            "has_stored_credentials": False,
+            "is_logging_in": False,
+            "login_error": None,
+        }
+
+    def _set(self, key: str, value: Any) -> None:
+        """Set a single state value and emit its signal if changed."""
+        self.update_many({key: value})
+
+    def update_many(self, values: dict[str, Any]) -> list[str]:
+        """Set several state values, then emit a signal for each one that changed.
+
+        All values are stored before any signal fires, so slots always see a
+        consistent state.
+
+        Args:
+            values: Mapping of state key to new value
+
+        Returns:
+            Keys whose value changed
+        """
+        changed = [key for key, value in values.items() if self._values[key] != value]
+        for key in changed:
+            self._values[key] = values[key]
+        for key in changed:
+            signal_name, default = self._SIGNALS[key]
+            value = self._values[key]
+            getattr(self, signal_name).emit(default if value is None else value)
+        return changed
 
     @property
     def authenticated(self) -> bool:
         """Get authentication status."""
-        return self._authenticated
+        return self._values["authenticated"]
 
     @authenticated.setter
     def authenticated(self, value: bool) -> None:
         """Set authentication status and emit signal if changed."""
-        if self._authenticated != value:
-            self._authenticated = value
-            self.authenticated_changed.emit(value)
+        self._set("authenticated", value)
 
     @property
     def has_stored_credentials(self) -> bool:
         """Get whether credentials are stored."""
-        return self._has_stored_credentials
+        return self._values["has_stored_credentials"]
 
     @has_stored_credentials.setter
     def has_stored_credentials(self, value: bool) -> None:
         """Set stored credentials status and emit signal if changed."""
-        if self._has_stored_credentials != value:
-            self._has_stored_credentials = value
-            self.has_stored_credentials_changed.emit(value)
+        self._set("has_stored_credentials", value)
 
     @property
     def is_logging_in(self) -> bool:
         """Get login in progress status."""
-        return self._is_logging_in
+        return self._values["is_logging_in"]
 
     @is_logging_in.setter
     def is_logging_in(self, value: bool) -> None:
         """Set login in progress status and emit signal if changed."""
-        if self._is_logging_in != value:
-            self._is_logging_in = value
-            self.is_logging_in_changed.emit(value)
+        self._set("is_logging_in", value)
 
     @property
     def login_error(self) -> str | None:
         """Get login error message."""
-        return self._login_error
+        return self._values["login_error"]
 
     @login_error.setter
     def login_error(self, value: str | None) -> None:
         """Set login error message and emit signal if changed."""
-        if self._login_error != value:
-            self._login_error = value
-            self.login_error_changed.emit(value or "")
+        self._set("login_error", value)
 
+    @Slot(dict)
     def update_from_auth_status(self, status: dict) -> None:
         """Update state from TastyTradeService.get_auth_status().
 
+        Registered as a Qt slot so other threads can queue updates with
+        QMetaObject.invokeMethod instead of touching the state directly.
+
         Args:
             status: Dictionary with 'authenticated' and 'has_stored_credentials' keys
         """
-        self.authenticated = status.get("authenticated", False)
-        self.has_stored_credentials = status.get("has_stored_credentials", False)
+        self.update_many(
+            {
+                "authenticated": status.get("authenticated", False),
+                "has_stored_credentials": status.get("has_stored_credentials", False),
+            }
+        )
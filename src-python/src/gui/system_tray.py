@@ -1,19 +1,29 @@
 """System tray / menu bar icon management."""
 
+import functools
 import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from PySide6.QtCore import QByteArray, QObject, Qt, Signal
-from PySide6.QtGui import QAction, QIcon, QPainter, QPixmap
-from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
+from PySide6.QtGui import QAction, QIcon
 from PySide6.QtWidgets import QApplication, QMenu, QSystemTrayIcon
 
 from src.server.config import ServerConfig
 
+if TYPE_CHECKING:
+    from PySide6.QtSvg import QSvgRenderer
+
 logger = logging.getLogger("ttai.gui")
 
+# Logical sizes the tray icon is rendered at. Trays differ (16px on Windows,
+# 22px on Linux panels and the macOS menu bar, larger on HiDPI panels); Qt
+# picks the closest pixmap and only ever scales it down
+TRAY_ICON_SIZES = (16, 22, 32)
+
 
+@functools.cache
 def _get_resources_dir() -> Path:
     """Get resources directory, handling PyInstaller frozen apps."""
     if getattr(sys, "frozen", False):
@@ -22,6 +32,12 @@ def _get_resources_dir() -> Path:
     return Path(__file__).parent / "resources"
 
 
+@functools.cache
+def _is_tray_available() -> bool:
+    """Whether the platform has a system tray (queried once; may hit DBus on Linux)."""
+    return QSystemTrayIcon.isSystemTrayAvailable()
+
+
 def _load_tray_icon(svg_path: Path) -> QIcon:
     """Load an SVG as a system tray icon.
 
@@ -29,33 +45,76 @@ def _load_tray_icon(svg_path: Path) -> QIcon:
     handle light/dark menu bar automatically. On other platforms,
     renders with a visible color.
     """
+    # Prefer the variant pre-colored by scripts/build.py (e.g. pulse.light.svg)
+    prebaked = svg_path.with_name(f"{svg_path.stem}.{_tray_variant(sys.platform)}.svg")
+    if prebaked.exists():
+        svg_path = prebaked
+
+    # Rasterize in device pixels, so the icon is crisp on HiDPI screens
+    screen = QApplication.instance().primaryScreen()
+    dpr = screen.devicePixelRatio() if screen is not None else 1.0
+
+    # The rendered icon only changes if the file does
+    return _render_tray_icon(str(svg_path), svg_path.stat().st_mtime_ns, sys.platform, dpr)
+
+
+def _tray_variant(platform: str) -> str:
+    """Name of the tray icon color variant for a platform."""
+    return "dark" if platform == "darwin" else "light"
+
+
+def _tray_stroke_color(platform: str) -> bytes:
+    """Stroke color for the tray icon on a platform, ready for SVG bytes."""
     # macOS menu bar icons should be black (system applies template mask)
     # Other platforms need a visible color
-    if sys.platform == "darwin":
-        stroke_color = "#000000"
-    else:
-        stroke_color = "#FFFFFF"
+    return b"#000000" if platform == "darwin" else b"#FFFFFF"
+
+
+@functools.lru_cache(maxsize=4)
+def _tray_renderer(svg_path: str, mtime_ns: int, platform: str) -> "QSvgRenderer":
+    """Parse the tray SVG once; every size of it shares the result."""
+    # QtSvg is only loaded once the tray is actually in use
+    from PySide6.QtCore import QByteArray
+    from PySide6.QtSvg import QSvgRenderer
 
-    svg_content = svg_path.read_text()
-    svg_content = svg_content.replace("currentColor", stroke_color)
+    # Substitute on the raw bytes: no decode/encode round trip through str.
+    # Pre-colored variants contain no currentColor and pass through as is.
+    svg_data = Path(svg_path).read_bytes().replace(b"currentColor", _tray_stroke_color(platform))
+    return QSvgRenderer(QByteArray(svg_data))
 
-    # Render SVG to pixmap at higher resolution for crisp display
-    # Qt will scale down as needed for the system tray
-    size = 128
-    svg_data = QByteArray(svg_content.encode())
-    renderer = QSvgRenderer(svg_data)
 
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.GlobalColor.transparent)
+@functools.lru_cache(maxsize=8)
+def _render_tray_icon(svg_path: str, mtime_ns: int, platform: str, dpr: float) -> QIcon:
+    """Render a tray icon; cached, as QIcon is implicitly shared.
+
+    Args:
+        svg_path: Path of the SVG file
+        mtime_ns: Modification time of the file, so edits invalidate the cache
+        platform: Platform to render for (sys.platform)
+        dpr: Device pixel ratio to render at
+
+    Returns:
+        The rendered icon, with a pixmap for each of TRAY_ICON_SIZES
+    """
+    from PySide6.QtGui import QPainter, QPixmap
+
+    renderer = _tray_renderer(svg_path, mtime_ns, platform)
 
-    painter = QPainter(pixmap)
-    renderer.render(painter)
-    painter.end()
+    icon = QIcon()
+    for size in TRAY_ICON_SIZES:
+        # Render at size * dpr device pixels, so it is crisp without Qt scaling
+        pixels = round(size * dpr)
+        pixmap = QPixmap(pixels, pixels)
+        pixmap.fill(Qt.GlobalColor.transparent)
 
-    icon = QIcon(pixmap)
+        painter = QPainter(pixmap)
+        renderer.render(painter)
+        painter.end()
+        pixmap.setDevicePixelRatio(dpr)
+        icon.addPixmap(pixmap)
 
     # On macOS, mark as template image so system handles light/dark mode
-    if sys.platform == "darwin":
+    if platform == "darwin":
         icon.setIsMask(True)
 
     return icon
@@ -82,8 +141,10 @@ class SystemTrayManager(QObject):
         super().__init__()
         self._app = app
         self._config = config
+        # The config doesn't change while the app runs
+        self._server_url = self._compute_server_url()
         self._tray_icon: QSystemTrayIcon | None = None
-        self._available = QSystemTrayIcon.isSystemTrayAvailable()
+        self._available = _is_tray_available()
 
         if not self._available:
             logger.warning("System tray is not available on this platform")
@@ -95,20 +156,10 @@ class SystemTrayManager(QObject):
         """Set up the system tray icon and context menu."""
         self._tray_icon = QSystemTrayIcon(self._app)
 
-        # Load icon from resources
-        resources_dir = _get_resources_dir()
-        icon_path = resources_dir / "pulse.svg"
-
-        if icon_path.exists():
-            icon = _load_tray_icon(icon_path)
-        else:
-            # Fallback to application icon if specific tray icon not found
-            logger.warning(f"Tray icon not found at {icon_path}, using fallback")
-            icon = self._app.windowIcon()
-            if icon.isNull():
-                icon = QIcon.fromTheme("application-default-icon")
-
-        self._tray_icon.setIcon(icon)
+        # Start with the (already loaded) application icon and render the real
+        # one from SVG once the event loop runs, off the first-paint path
+        self._tray_icon.setIcon(self._fallback_icon())
+        QTimer.singleShot(0, self._install_real_icon)
         self._tray_icon.setToolTip("TTAI - TastyTrade AI")
 
         # Create context menu
@@ -133,6 +184,26 @@ class SystemTrayManager(QObject):
         # Handle tray icon activation (double-click on Windows/Linux, click on macOS)
         self._tray_icon.activated.connect(self._on_tray_activated)
 
+    def _fallback_icon(self) -> QIcon:
+        """Get the application icon, for use when the tray SVG is unavailable."""
+        icon = self._app.windowIcon()
+        if icon.isNull():
+            icon = QIcon.fromTheme("application-default-icon")
+        return icon
+
+    def _install_real_icon(self) -> None:
+        """Render the tray SVG and set it as the tray icon."""
+        if self._tray_icon is None:
+            return
+
+        # Load icon from resources
+        icon_path = _get_resources_dir() / "pulse.svg"
+        if not icon_path.exists():
+            # Keep the application icon if specific tray icon not found
+            logger.warning(f"Tray icon not found at {icon_path}, using fallback")
+            return
+        self._tray_icon.setIcon(_load_tray_icon(icon_path))
+
     def show(self) -> None:
         """Show the tray icon."""
         if self._tray_icon:
@@ -156,16 +227,19 @@ class SystemTrayManager(QObject):
         """Handle quit menu action."""
         self.quit_requested.emit()
 
-    def _on_copy_url(self) -> None:
-        """Copy the MCP server URL to clipboard."""
+    def _compute_server_url(self) -> str:
+        """Build the MCP server URL offered by the copy action."""
         if self._config.ssl_enabled:
-            url = f"https://{self._config.ssl_local_domain}:{self._config.ssl_port}/mcp"
-        else:
-            url = f"http://{self._config.host}:{self._config.port}/mcp"
+            return f"https://{self._config.ssl_local_domain}:{self._config.ssl_port}/mcp"
+        return f"http://{self._config.host}:{self._config.port}/mcp"
 
+    def _on_copy_url(self) -> None:
+        """Copy the MCP server URL to clipboard."""
         clipboard = self._app.clipboard()
-        clipboard.setText(url)
-        logger.debug(f"Copied URL to clipboard: {url}")
+        # Don't notify clipboard watchers when nothing would change
+        if clipboard.text() != self._server_url:
+            clipboard.setText(self._server_url)
+        logger.debug(f"Copied URL to clipboard: {self._server_url}")
 
     def _on_tray_activated(self, reason: QSystemTrayIcon.ActivationReason) -> None:
         """Handle tray icon activation.
@@ -1,11 +1,34 @@
-"""TTAI GUI widgets."""
+"""TTAI GUI widgets.
 
-from src.gui.widgets.about_page import AboutPage
-from src.gui.widgets.connection_page import ConnectionPage
-from src.gui.widgets.settings_page import SettingsPage
+Pages are imported on first attribute access, so importing one page module
+(or this package) doesn't pull in the others.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.gui.widgets.about_page import AboutPage
+    from src.gui.widgets.connection_page import ConnectionPage
+    from src.gui.widgets.settings_page import SettingsPage
 
 __all__ = [
     "AboutPage",
     "ConnectionPage",
     "SettingsPage",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "AboutPage":
+        from src.gui.widgets.about_page import AboutPage
+
+        return AboutPage
+    if name == "ConnectionPage":
+        from src.gui.widgets.connection_page import ConnectionPage
+
+        return ConnectionPage
+    if name == "SettingsPage":
+        from src.gui.widgets.settings_page import SettingsPage
+
+        return SettingsPage
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,17 @@
 """About page widget."""
 
+import functools
 import sys
 from pathlib import Path
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QPainter, QPainterPath, QPixmap
+from PySide6.QtGui import QPainter, QPixmap
 from PySide6.QtWidgets import QFrame, QLabel, QScrollArea, QVBoxLayout, QWidget
 
 from src import __version__
 
 
+@functools.cache
 def _get_resources_dir() -> Path:
     """Get resources directory, handling PyInstaller frozen apps."""
     if getattr(sys, "frozen", False):
@@ -18,12 +20,25 @@ def _get_resources_dir() -> Path:
 
 
 def _load_rounded_icon(path: Path, size: int, radius: int, device_pixel_ratio: float) -> QPixmap:
-    """Load an icon and apply rounded corners, handling high-DPI displays."""
+    """Load an icon and apply rounded corners, handling high-DPI displays.
+
+    The result is cached and shared (QPixmap is copy-on-write). The icon does
+    not depend on the theme; if it ever does, the cache must be cleared on
+    theme changes.
+    """
+    return _load_rounded_icon_cached(str(path), size, radius, device_pixel_ratio)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_rounded_icon_cached(
+    path: str, size: int, radius: int, device_pixel_ratio: float
+) -> QPixmap:
+    """Render the rounded icon for _load_rounded_icon."""
     # Scale up for Retina/high-DPI displays
     scaled_size = int(size * device_pixel_ratio)
     scaled_radius = int(radius * device_pixel_ratio)
 
-    source = QPixmap(str(path)).scaled(
+    source = QPixmap(path).scaled(
         scaled_size, scaled_size,
         Qt.AspectRatioMode.KeepAspectRatio,
         Qt.TransformationMode.SmoothTransformation,
@@ -33,12 +48,14 @@ def _load_rounded_icon(path: Path, size: int, radius: int, device_pixel_ratio: f
     rounded.fill(Qt.GlobalColor.transparent)
 
     painter = QPainter(rounded)
-    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-    path_rect = QPainterPath()
-    path_rect.addRoundedRect(0, 0, scaled_size, scaled_size, scaled_radius, scaled_radius)
-    painter.setClipPath(path_rect)
     painter.drawPixmap(0, 0, source)
+
+    # Mask to a rounded rect: keep the icon only where the shape is drawn
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_DestinationIn)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(Qt.GlobalColor.black)
+    painter.drawRoundedRect(0, 0, scaled_size, scaled_size, scaled_radius, scaled_radius)
     painter.end()
 
     # Tell Qt about the device pixel ratio so it displays at correct size
@@ -1,10 +1,12 @@
 """Connection page widget with MCP and TastyTrade connection settings."""
 
 import logging
+from typing import TYPE_CHECKING
 
 from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QBrush, QColor, QGuiApplication, QPainter, QPixmap
+from PySide6.QtGui import QBrush, QColor, QGuiApplication, QPainter, QPixmap, QShowEvent
 from PySide6.QtWidgets import (
+    QApplication,
     QFormLayout,
     QFrame,
     QHBoxLayout,
@@ -16,11 +18,12 @@ from PySide6.QtWidgets import (
 )
 from qasync import asyncSlot
 
-from src.auth.credentials import CredentialManager
-from src.gui.state import AppState
-from src.gui.widgets.login_dialog import LoginDialog
-from src.server.config import ServerConfig
-from src.services.tastytrade import TastyTradeService
+if TYPE_CHECKING:
+    from src.auth.credentials import CredentialManager
+    from src.gui.state import AppState
+    from src.gui.widgets.login_dialog import LoginDialog
+    from src.server.config import ServerConfig
+    from src.services.tastytrade import TastyTradeService
 
 logger = logging.getLogger("ttai.gui")
 
@@ -30,10 +33,10 @@ class ConnectionPage(QScrollArea):
 
     def __init__(
         self,
-        state: AppState,
-        tastytrade_service: TastyTradeService,
-        credential_manager: CredentialManager,
-        config: ServerConfig,
+        state: "AppState",
+        tastytrade_service: "TastyTradeService",
+        credential_manager: "CredentialManager",
+        config: "ServerConfig",
         parent: QWidget | None = None,
     ) -> None:
         """Initialize the connection page."""
@@ -62,31 +65,35 @@ class ConnectionPage(QScrollArea):
         self._form.setHorizontalSpacing(16)
         self._form.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
 
+        # Shared by all section labels: the default QLabel font, in bold
+        self._section_font = QApplication.font("QLabel")
+        self._section_font.setBold(True)
+
         # --- MCP Server ---
-        mcp_field = QWidget()
-        mcp_vbox = QVBoxLayout(mcp_field)
+        # Rows are plain layouts: QFormLayout takes them directly as fields,
+        # without an intermediate container widget each
+        mcp_vbox = QVBoxLayout()
         mcp_vbox.setContentsMargins(0, 0, 0, 0)
         mcp_vbox.setSpacing(2)
 
         # HTTPS URL (if SSL enabled)
         if self.config.ssl_enabled:
             https_url = f"https://{self.config.ssl_local_domain}:{self.config.ssl_port}/mcp"
-            mcp_vbox.addWidget(self._make_url_row(https_url))
+            mcp_vbox.addLayout(self._make_url_row(https_url))
 
         # HTTP localhost URL
         http_url = f"http://{self.config.host}:{self.config.port}/mcp"
-        mcp_vbox.addWidget(self._make_url_row(http_url))
+        mcp_vbox.addLayout(self._make_url_row(http_url))
 
         # Description
         desc = QLabel("Add this URL to your MCP client configuration")
         desc.setEnabled(False)
         mcp_vbox.addWidget(desc)
 
-        self._form.addRow(self._make_section_label("MCP Server:"), mcp_field)
+        self._form.addRow(self._make_section_label("MCP Server:"), mcp_vbox)
 
         # --- TastyTrade ---
-        tasty_row = QWidget()
-        tasty_layout = QHBoxLayout(tasty_row)
+        tasty_layout = QHBoxLayout()
         tasty_layout.setContentsMargins(0, 0, 0, 0)
         tasty_layout.setSpacing(8)
 
@@ -111,14 +118,12 @@ class ConnectionPage(QScrollArea):
 
         tasty_layout.addStretch()
 
-        self._form.addRow(self._make_section_label("TastyTrade:"), tasty_row)
+        self._form.addRow(self._make_section_label("TastyTrade:"), tasty_layout)
 
     def _make_section_label(self, text: str) -> QLabel:
         """Create a bold section label."""
         label = QLabel(text)
-        font = label.font()
-        font.setBold(True)
-        label.setFont(font)
+        label.setFont(self._section_font)
         return label
 
     def _make_status_icon(self, connected: bool) -> QPixmap:
@@ -138,10 +143,9 @@ class ConnectionPage(QScrollArea):
         painter.end()
         return pixmap
 
-    def _make_url_row(self, url: str) -> QWidget:
+    def _make_url_row(self, url: str) -> QHBoxLayout:
         """Create a row with URL label and copy button."""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
+        layout = QHBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
 
         url_label = QLabel(url)
@@ -154,7 +158,7 @@ class ConnectionPage(QScrollArea):
 
         layout.addStretch()
 
-        return widget
+        return layout
 
     def _connect_signals(self) -> None:
         """Connect state signals."""
@@ -177,19 +181,34 @@ class ConnectionPage(QScrollArea):
         """Copy the given URL to clipboard."""
         clipboard = QGuiApplication.clipboard()
         if clipboard:
-            clipboard.setText(url)
+            # Don't notify clipboard watchers when nothing would change
+            if clipboard.text() != url:
+                clipboard.setText(url)
             btn.setText("Copied!")
             QTimer.singleShot(1500, lambda: btn.setText("Copy"))
 
-    def _show_login_dialog(self) -> None:
-        """Show the login dialog."""
+    def showEvent(self, event: QShowEvent) -> None:  # noqa: N802 - Qt override
+        """Build the login dialog in the background once the page is visible."""
+        super().showEvent(event)
+        if self._login_dialog is None:
+            # After the pending paint, so a Connect click opens it instantly
+            QTimer.singleShot(0, self._ensure_login_dialog)
+
+    def _ensure_login_dialog(self) -> "LoginDialog":
+        """Create the (reused, initially hidden) login dialog if needed."""
         if self._login_dialog is None:
+            from src.gui.widgets.login_dialog import LoginDialog
+
             self._login_dialog = LoginDialog(self.window())
             self._login_dialog.connect_btn.clicked.connect(self._on_dialog_connect)
+        return self._login_dialog
 
-        self._login_dialog.clear()
-        self._login_dialog.show()
-        self._login_dialog.raise_()
+    def _show_login_dialog(self) -> None:
+        """Show the login dialog."""
+        dialog = self._ensure_login_dialog()
+        dialog.clear()
+        dialog.show()
+        dialog.raise_()
 
     @asyncSlot()
     async def _on_dialog_connect(self) -> None:
@@ -1,5 +1,7 @@
 """Login dialog for TastyTrade authentication."""
 
+import functools
+
 from PySide6.QtCore import QUrl
 from PySide6.QtGui import QDesktopServices
 from PySide6.QtWidgets import (
@@ -16,6 +18,17 @@ from PySide6.QtWidgets import (
 TASTYTRADE_API_URL = "https://my.tastytrade.com/app.html#/manage/api-access"
 
 
+@functools.cache
+def _api_access_url() -> QUrl:
+    """Parsed TastyTrade API access page URL (built once)."""
+    return QUrl(TASTYTRADE_API_URL)
+
+
+def _open_api_access_page() -> None:
+    """Open the TastyTrade API access page in the default browser."""
+    QDesktopServices.openUrl(_api_access_url())
+
+
 class LoginDialog(QDialog):
     """Native dialog for TastyTrade login credentials."""
 
@@ -23,6 +36,8 @@ class LoginDialog(QDialog):
         """Initialize the login dialog."""
         super().__init__(parent)
         self._setup_ui()
+        # The dialog is reused: don't keep secrets in the fields once it closes
+        self.finished.connect(self.clear)
 
     def _setup_ui(self) -> None:
         """Set up the dialog UI."""
@@ -65,9 +80,7 @@ class LoginDialog(QDialog):
         btn_layout = QHBoxLayout()
 
         self.get_creds_btn = QPushButton("Get Credentials...")
-        self.get_creds_btn.clicked.connect(
-            lambda: QDesktopServices.openUrl(QUrl(TASTYTRADE_API_URL))
-        )
+        self.get_creds_btn.clicked.connect(_open_api_access_page)
         btn_layout.addWidget(self.get_creds_btn)
 
         btn_layout.addStretch()
@@ -101,12 +114,17 @@ class LoginDialog(QDialog):
 
     def set_loading(self, loading: bool) -> None:
         """Set the loading state."""
-        self.connect_btn.setEnabled(not loading)
-        self.connect_btn.setText("Connecting..." if loading else "Connect")
-        self.cancel_btn.setEnabled(not loading)
-        self.get_creds_btn.setEnabled(not loading)
-        self.client_secret_input.setEnabled(not loading)
-        self.refresh_token_input.setEnabled(not loading)
+        # Repaint once for all the changes below
+        self.setUpdatesEnabled(False)
+        try:
+            self.connect_btn.setEnabled(not loading)
+            self.connect_btn.setText("Connecting..." if loading else "Connect")
+            self.cancel_btn.setEnabled(not loading)
+            self.get_creds_btn.setEnabled(not loading)
+            self.client_secret_input.setEnabled(not loading)
+            self.refresh_token_input.setEnabled(not loading)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def clear(self) -> None:
         """Clear the form."""
@@ -1,11 +1,15 @@
 """Settings page widget with application preferences."""
 
+import atexit
+import functools
 import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
+    QApplication,
     QCheckBox,
     QFormLayout,
     QFrame,
@@ -16,20 +20,36 @@ from PySide6.QtWidgets import (
 
 from src.gui.preferences import PreferencesManager
 
+# Only Windows has winreg; type checkers see it on every platform
+if sys.platform == "win32" or TYPE_CHECKING:
+    import winreg
+
 logger = logging.getLogger("ttai.gui")
 
 
-def _get_app_executable() -> str:
-    """Get the path to the application executable."""
-    if getattr(sys, "frozen", False):
-        # Running as PyInstaller bundle
-        return sys.executable
-    # Running from source - not supported for launch at startup
-    return ""
+# Launch at startup needs a PyInstaller bundle; running from source isn't supported
+_IS_BUNDLED = bool(getattr(sys, "frozen", False))
+_APP_EXECUTABLE = sys.executable if _IS_BUNDLED else ""
 
 
 # --- macOS ---
 
+_MACOS_PLIST_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+    <key>Label</key>
+    <string>dev.tt-ai.ttai</string>
+    <key>ProgramArguments</key>
+    <array>
+        <string>{app_path}</string>
+    </array>
+    <key>RunAtLoad</key>
+    <true/>
+</dict>
+</plist>
+"""
+
 
 def _get_macos_launch_agent_path() -> Path:
     """Get the path to the macOS launch agent plist file."""
@@ -46,30 +66,14 @@ def _set_launch_at_startup_macos(enabled: bool) -> bool:
     plist_path = _get_macos_launch_agent_path()
 
     if enabled:
-        app_path = _get_app_executable()
-        if not app_path:
+        if not _IS_BUNDLED:
             logger.warning("Cannot enable launch at startup: not running as bundled app")
             return False
 
         plist_path.parent.mkdir(parents=True, exist_ok=True)
 
-        plist_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>dev.tt-ai.ttai</string>
-    <key>ProgramArguments</key>
-    <array>
-        <string>{app_path}</string>
-    </array>
-    <key>RunAtLoad</key>
-    <true/>
-</dict>
-</plist>
-"""
         try:
-            plist_path.write_text(plist_content)
+            plist_path.write_text(_MACOS_PLIST_TEMPLATE.format(app_path=_APP_EXECUTABLE))
             logger.info(f"Created launch agent at {plist_path}")
             return True
         except OSError as e:
@@ -90,24 +94,32 @@ def _set_launch_at_startup_macos(enabled: bool) -> bool:
 # --- Windows ---
 
 
+_WINDOWS_RUN_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
+
+
+@functools.cache
+def _windows_run_key() -> "winreg.HKEYType":
+    """Open the per-user Run key once for both reading and writing.
+
+    The handle is reused by the check and toggle below and closed at exit.
+    """
+    key = winreg.OpenKey(
+        winreg.HKEY_CURRENT_USER,
+        _WINDOWS_RUN_KEY,
+        0,
+        winreg.KEY_READ | winreg.KEY_SET_VALUE,
+    )
+    atexit.register(winreg.CloseKey, key)
+    return key
+
+
 def _is_launch_at_startup_enabled_windows() -> bool:
     """Check if launch at startup is enabled on Windows."""
     try:
-        import winreg
-
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            r"Software\Microsoft\Windows\CurrentVersion\Run",
-            0,
-            winreg.KEY_READ,
-        )
-        try:
-            winreg.QueryValueEx(key, "TTAI")
-            return True
-        except FileNotFoundError:
-            return False
-        finally:
-            winreg.CloseKey(key)
+        winreg.QueryValueEx(_windows_run_key(), "TTAI")
+        return True
+    except FileNotFoundError:
+        return False
     except Exception as e:
         logger.error(f"Failed to check Windows startup registry: {e}")
         return False
@@ -116,31 +128,20 @@ def _is_launch_at_startup_enabled_windows() -> bool:
 def _set_launch_at_startup_windows(enabled: bool) -> bool:
     """Enable or disable launch at startup on Windows."""
     try:
-        import winreg
-
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            r"Software\Microsoft\Windows\CurrentVersion\Run",
-            0,
-            winreg.KEY_SET_VALUE,
-        )
-        try:
-            if enabled:
-                app_path = _get_app_executable()
-                if not app_path:
-                    logger.warning("Cannot enable launch at startup: not running as bundled app")
-                    return False
-                winreg.SetValueEx(key, "TTAI", 0, winreg.REG_SZ, f'"{app_path}"')
-                logger.info("Added TTAI to Windows startup registry")
-            else:
-                try:
-                    winreg.DeleteValue(key, "TTAI")
-                    logger.info("Removed TTAI from Windows startup registry")
-                except FileNotFoundError:
-                    pass  # Already removed
-            return True
-        finally:
-            winreg.CloseKey(key)
+        key = _windows_run_key()
+        if enabled:
+            if not _IS_BUNDLED:
+                logger.warning("Cannot enable launch at startup: not running as bundled app")
+                return False
+            winreg.SetValueEx(key, "TTAI", 0, winreg.REG_SZ, f'"{_APP_EXECUTABLE}"')
+            logger.info("Added TTAI to Windows startup registry")
+        else:
+            try:
+                winreg.DeleteValue(key, "TTAI")
+                logger.info("Removed TTAI from Windows startup registry")
+            except FileNotFoundError:
+                pass  # Already removed
+        return True
     except Exception as e:
         logger.error(f"Failed to modify Windows startup registry: {e}")
         return False
@@ -148,6 +149,16 @@ def _set_launch_at_startup_windows(enabled: bool) -> bool:
 
 # --- Linux ---
 
+_LINUX_DESKTOP_TEMPLATE = """[Desktop Entry]
+Type=Application
+Name=TTAI
+Comment=TastyTrade AI Assistant
+Exec={app_path}
+Hidden=false
+NoDisplay=false
+X-GNOME-Autostart-enabled=true
+"""
+
 
 def _get_linux_autostart_path() -> Path:
     """Get the path to the Linux autostart desktop file."""
@@ -164,24 +175,14 @@ def _set_launch_at_startup_linux(enabled: bool) -> bool:
     desktop_path = _get_linux_autostart_path()
 
     if enabled:
-        app_path = _get_app_executable()
-        if not app_path:
+        if not _IS_BUNDLED:
             logger.warning("Cannot enable launch at startup: not running as bundled app")
             return False
 
         desktop_path.parent.mkdir(parents=True, exist_ok=True)
 
-        desktop_content = f"""[Desktop Entry]
-Type=Application
-Name=TTAI
-Comment=TastyTrade AI Assistant
-Exec={app_path}
-Hidden=false
-NoDisplay=false
-X-GNOME-Autostart-enabled=true
-"""
         try:
-            desktop_path.write_text(desktop_content)
+            desktop_path.write_text(_LINUX_DESKTOP_TEMPLATE.format(app_path=_APP_EXECUTABLE))
             logger.info(f"Created autostart entry at {desktop_path}")
             return True
         except OSError as e:
@@ -202,32 +203,39 @@ X-GNOME-Autostart-enabled=true
 # --- Platform dispatch ---
 
 
+# Resolved once: sys.platform can't change while the process runs
+if sys.platform == "darwin":
+    _is_enabled_impl = _is_launch_at_startup_enabled_macos
+    _set_impl = _set_launch_at_startup_macos
+elif sys.platform == "win32":
+    _is_enabled_impl = _is_launch_at_startup_enabled_windows
+    _set_impl = _set_launch_at_startup_windows
+elif sys.platform.startswith("linux"):
+    _is_enabled_impl = _is_launch_at_startup_enabled_linux
+    _set_impl = _set_launch_at_startup_linux
+else:
+    _is_enabled_impl = _set_impl = None
+
+_PLATFORM_SUPPORTED = _set_impl is not None
+
+
+@functools.cache
 def _is_launch_at_startup_enabled() -> bool:
-    """Check if launch at startup is currently enabled."""
-    if sys.platform == "darwin":
-        return _is_launch_at_startup_enabled_macos()
-    elif sys.platform == "win32":
-        return _is_launch_at_startup_enabled_windows()
-    elif sys.platform.startswith("linux"):
-        return _is_launch_at_startup_enabled_linux()
-    return False
+    """Check if launch at startup is currently enabled.
+
+    Cached: the registry/filesystem is only checked again after
+    _set_launch_at_startup changes it.
+    """
+    return _is_enabled_impl() if _is_enabled_impl is not None else False
 
 
 def _set_launch_at_startup(enabled: bool) -> bool:
     """Enable or disable launch at startup."""
-    if sys.platform == "darwin":
-        return _set_launch_at_startup_macos(enabled)
-    elif sys.platform == "win32":
-        return _set_launch_at_startup_windows(enabled)
-    elif sys.platform.startswith("linux"):
-        return _set_launch_at_startup_linux(enabled)
-    logger.warning(f"Launch at startup not supported on platform: {sys.platform}")
-    return False
-
-
-def _is_platform_supported() -> bool:
-    """Check if the current platform supports launch at startup."""
-    return sys.platform in ("darwin", "win32") or sys.platform.startswith("linux")
+    _is_launch_at_startup_enabled.cache_clear()
+    if _set_impl is None:
+        logger.warning(f"Launch at startup not supported on platform: {sys.platform}")
+        return False
+    return _set_impl(enabled)
 
 
 class SettingsPage(QScrollArea):
@@ -255,24 +263,26 @@ class SettingsPage(QScrollArea):
         self.setFrameShape(QFrame.Shape.NoFrame)
 
         content = QWidget()
-        self.setWidget(content)
-
         self._form = QFormLayout(content)
         self._form.setContentsMargins(30, 30, 30, 30)
         self._form.setVerticalSpacing(16)
         self._form.setHorizontalSpacing(16)
         self._form.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
 
+        # Shared by all section labels: the default QLabel font, in bold
+        self._section_font = QApplication.font("QLabel")
+        self._section_font.setBold(True)
+
         # --- Launch at Startup ---
         self._launch_checkbox = QCheckBox("Launch TTAI when you log in")
         self._launch_checkbox.setChecked(_is_launch_at_startup_enabled())
         self._launch_checkbox.stateChanged.connect(self._on_launch_changed)
 
         # Disable if not running as bundled app or unsupported platform
-        if not _get_app_executable():
+        if not _IS_BUNDLED:
             self._launch_checkbox.setEnabled(False)
             self._launch_checkbox.setToolTip("Only available when running as a bundled application")
-        elif not _is_platform_supported():
+        elif not _PLATFORM_SUPPORTED:
             self._launch_checkbox.setEnabled(False)
             self._launch_checkbox.setToolTip(f"Not supported on {sys.platform}")
 
@@ -290,12 +300,14 @@ class SettingsPage(QScrollArea):
 
         self._form.addRow(self._make_section_label("Window:"), self._show_window_checkbox)
 
+        # Hand the scroll area the finished content, so it lays it out once
+        # rather than resizing it as each row is added
+        self.setWidget(content)
+
     def _make_section_label(self, text: str) -> QLabel:
         """Create a bold section label."""
         label = QLabel(text)
-        font = label.font()
-        font.setBold(True)
-        label.setFont(font)
+        label.setFont(self._section_font)
         return label
 
     def _on_launch_changed(self, state: int) -> None:
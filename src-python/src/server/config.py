@@ -1,14 +1,23 @@
 """Server configuration management."""
 
+import logging
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Literal
 
+logger = logging.getLogger("ttai.server")
 
-@dataclass
+
+@dataclass(frozen=True)
 class ServerConfig:
-    """Configuration for the TTAI MCP server."""
+    """Configuration for the TTAI MCP server.
+
+    Instances are immutable, so derived values are cached on first access.
+    Use ``dataclasses.replace`` to build a config with different values.
+    """
 
     transport: Literal["stdio", "http"] = "http"
     host: str = "localhost"
@@ -21,34 +30,34 @@ class ServerConfig:
     ssl_port: int = 5181  # HTTPS port
     ssl_cert_api_override: str = ""  # Override cert API URL (for local dev)
 
-    @property
+    @cached_property
     def db_path(self) -> Path:
         """Get the path to the SQLite database."""
         return self.data_dir / "ttai.db"
 
-    @property
+    @cached_property
     def log_dir(self) -> Path:
         """Get the path to the log directory."""
         return self.data_dir / "logs"
 
-    @property
+    @cached_property
     def ssl_cert_dir(self) -> Path:
         """Get the path to the SSL certificate directory."""
         return self.data_dir / "ssl"
 
-    @property
+    @cached_property
     def ssl_cert_api(self) -> str:
         """Get the URL for the certificate API."""
         if self.ssl_cert_api_override:
             return self.ssl_cert_api_override
         return f"https://api.{self.ssl_domain}/cert" if self.ssl_domain else ""
 
-    @property
+    @cached_property
     def ssl_local_domain(self) -> str:
         """Get the local domain for HTTPS server."""
         return f"local.{self.ssl_domain}" if self.ssl_domain else ""
 
-    @property
+    @cached_property
     def ssl_enabled(self) -> bool:
         """Check if SSL is configured."""
         return bool(self.ssl_domain)
@@ -69,20 +78,36 @@ class ServerConfig:
         Returns:
             ServerConfig instance with values from environment
         """
-        transport_str = os.environ.get("TTAI_TRANSPORT", "http").lower()
+        env = os.environ
+        transport_str = env.get("TTAI_TRANSPORT", "http").lower()
         transport: Literal["stdio", "http"] = "stdio" if transport_str == "stdio" else "http"
 
+        # Path.home() looks up the user database, so only call it when needed
+        data_dir = env.get("TTAI_DATA_DIR")
+
         return cls(
             transport=transport,
-            host=os.environ.get("TTAI_HOST", "localhost"),
-            port=int(os.environ.get("TTAI_PORT", "5180")),
-            log_level=os.environ.get("TTAI_LOG_LEVEL", "INFO").upper(),
-            data_dir=Path(os.environ.get("TTAI_DATA_DIR", str(Path.home() / ".ttai"))),
-            ssl_domain=os.environ.get("TTAI_SSL_DOMAIN", "tt-ai.dev"),
-            ssl_port=int(os.environ.get("TTAI_SSL_PORT", "5181")),
-            ssl_cert_api_override=os.environ.get("TTAI_SSL_CERT_API", ""),
+            host=env.get("TTAI_HOST", "localhost"),
+            port=_env_int(env, "TTAI_PORT", 5180),
+            log_level=env.get("TTAI_LOG_LEVEL", "INFO").upper(),
+            data_dir=Path(data_dir) if data_dir else Path.home() / ".ttai",
+            ssl_domain=env.get("TTAI_SSL_DOMAIN", "tt-ai.dev"),
+            ssl_port=_env_int(env, "TTAI_SSL_PORT", 5181),
+            ssl_cert_api_override=env.get("TTAI_SSL_CERT_API", ""),
         )
 
 
+def _env_int(env: Mapping[str, str], name: str, default: int) -> int:
+    """Read an integer environment variable, falling back to the default if unset or invalid."""
+    value = env.get(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={value!r}, using {default}")
+        return default
+
+
 # Global configuration instance
 config = ServerConfig.from_env()
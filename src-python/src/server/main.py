@@ -3,9 +3,15 @@
 import argparse
 import asyncio
 import contextlib
+import dataclasses
+import json
 import logging
+import os
 import sys
+import time
+from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import uvicorn
 from mcp.server import Server
@@ -13,106 +19,188 @@ from mcp.server.stdio import stdio_server
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from starlette.routing import Mount, Route
 
-from src.auth.credentials import CredentialManager
 from src.server.config import ServerConfig
 from src.server.ssl import CertificateFetchError, CertificateManager
 from src.server.tools import register_tools
-from src.services.cache import CacheService
-from src.services.tastytrade import TastyTradeService
 from src.utils.logging import setup_logging
 
-# Global reference to TastyTrade service for REST API
-_tastytrade_service: TastyTradeService | None = None
+try:
+    import orjson
+except ImportError:  # optional, installed with the "speedups" extra
+    orjson = None
+
+if TYPE_CHECKING:
+    from src.services.tastytrade import TastyTradeService
+
+# Global TastyTrade service shared by MCP tools and the REST API, created on
+# first use from the data dir recorded by create_server
+_tastytrade_service: "TastyTradeService | None" = None
+_tastytrade_data_dir: Path | None = None
+
+# Serialized /api/auth-status body as (auth state version, created at, body).
+# The frontend polls it; the TTL picks up credential files changed on disk
+_AUTH_STATUS_TTL = 1.0
+_auth_status_cache: tuple[int, float, bytes] | None = None
 
 logger = logging.getLogger("ttai.server")
 
 
+class _JSONResponse(JSONResponse):
+    """JSON response serialized with orjson when it is installed.
+
+    orjson produces the same compact UTF-8 output as Starlette's json.dumps
+    settings, but several times faster and straight to bytes.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content)
+
+
+def get_tastytrade_service() -> "TastyTradeService | None":
+    """Get the shared TastyTrade service, creating it on first use.
+
+    Importing the TastyTrade SDK is the expensive part, so it is deferred
+    until a tool or endpoint needs the service (stdio clients may never).
+
+    Returns:
+        The shared service, or None if create_server hasn't run yet
+    """
+    global _tastytrade_service
+
+    if _tastytrade_service is None and _tastytrade_data_dir is not None:
+        from src.auth.credentials import CredentialManager
+        from src.services.cache import CacheService
+        from src.services.tastytrade import TastyTradeService
+
+        _tastytrade_service = TastyTradeService(
+            CredentialManager(_tastytrade_data_dir), CacheService()
+        )
+        logger.debug(f"TastyTrade service created: {_tastytrade_service}")
+
+    return _tastytrade_service
+
+
 def create_server(cfg: ServerConfig) -> Server:
     """Create and configure the MCP server.
 
+    The TastyTrade service is not created here; see get_tastytrade_service.
+
     Args:
         cfg: Server configuration
 
     Returns:
         Configured MCP Server instance with tools registered
     """
-    global _tastytrade_service
+    global _tastytrade_data_dir
 
     server = Server("ttai-server")
-
-    # Initialize services
-    credential_manager = CredentialManager(cfg.data_dir)
-    cache_service = CacheService()
-    tastytrade_service = TastyTradeService(credential_manager, cache_service)
-
-    # Store global reference for REST API
-    _tastytrade_service = tastytrade_service
-    logger.debug(f"TastyTrade service created and stored: {_tastytrade_service}")
+    _tastytrade_data_dir = cfg.data_dir
 
     # Register tools with services
-    register_tools(server, tastytrade_service)
+    register_tools(server, get_tastytrade_service)
 
     return server
 
 
+async def _read_json(request: Request) -> Any:
+    """Parse the request body as JSON, using orjson when it is installed.
+
+    Args:
+        request: The incoming request
+
+    Returns:
+        The decoded body
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON (orjson's error
+            is a subclass)
+    """
+    body = await request.body()
+    if orjson is None:
+        return json.loads(body)
+    return orjson.loads(body)
+
+
 # REST API handlers for Tauri frontend
-async def handle_health(request: Request) -> JSONResponse:
+async def handle_health(request: Request) -> _JSONResponse:
     """Health check endpoint."""
-    return JSONResponse({"status": "ok"})
+    return _JSONResponse({"status": "ok"})
 
 
-async def handle_auth_status(request: Request) -> JSONResponse:
-    """Get authentication status."""
-    if _tastytrade_service is None:
-        return JSONResponse({"error": "Service not initialized"}, status_code=500)
+async def handle_auth_status(request: Request) -> Response:
+    """Get authentication status.
 
-    return JSONResponse(_tastytrade_service.get_auth_status())
+    The serialized status is reused until login/logout changes the service's
+    auth state or it is older than _AUTH_STATUS_TTL.
+    """
+    global _auth_status_cache
 
+    service = get_tastytrade_service()
+    if service is None:
+        return _JSONResponse({"error": "Service not initialized"}, status_code=500)
 
-async def handle_login(request: Request) -> JSONResponse:
+    version = service.auth_state_version
+    now = time.monotonic()
+    cached = _auth_status_cache
+    if cached is None or cached[0] != version or now - cached[1] > _AUTH_STATUS_TTL:
+        body = _JSONResponse(service.get_auth_status()).body
+        cached = _auth_status_cache = (version, now, body)
+
+    return Response(cached[2], media_type="application/json")
+
+
+async def handle_login(request: Request) -> _JSONResponse:
     """Login to TastyTrade."""
-    if _tastytrade_service is None:
-        return JSONResponse({"error": "Service not initialized"}, status_code=500)
+    service = get_tastytrade_service()
+    if service is None:
+        return _JSONResponse({"error": "Service not initialized"}, status_code=500)
 
     try:
-        body = await request.json()
+        body = await _read_json(request)
         client_secret = body.get("client_secret")
         refresh_token = body.get("refresh_token")
         remember_me = body.get("remember_me", True)
 
         if not client_secret or not refresh_token:
-            return JSONResponse({
+            return _JSONResponse({
                 "success": False,
                 "error": "client_secret and refresh_token are required"
             }, status_code=400)
 
-        success = await _tastytrade_service.login(client_secret, refresh_token, remember_me)
+        success = await service.login(client_secret, refresh_token, remember_me)
         if success:
-            return JSONResponse({"success": True})
+            return _JSONResponse({"success": True})
         else:
-            return JSONResponse({"success": False, "error": "Login failed"})
+            return _JSONResponse({"success": False, "error": "Login failed"})
+    except json.JSONDecodeError:
+        return _JSONResponse({"success": False, "error": "Invalid JSON body"}, status_code=400)
     except Exception as e:
         logger.exception("Login failed")
-        return JSONResponse({"success": False, "error": str(e)})
+        return _JSONResponse({"success": False, "error": str(e)})
 
 
-async def handle_logout(request: Request) -> JSONResponse:
+async def handle_logout(request: Request) -> _JSONResponse:
     """Logout from TastyTrade."""
-    if _tastytrade_service is None:
-        return JSONResponse({"error": "Service not initialized"}, status_code=500)
+    service = get_tastytrade_service()
+    if service is None:
+        return _JSONResponse({"error": "Service not initialized"}, status_code=500)
 
     try:
-        body = await request.json()
+        body = await _read_json(request)
         clear_credentials = body.get("clear_credentials", False)
 
-        await _tastytrade_service.logout(clear_credentials)
-        return JSONResponse({"success": True})
+        await service.logout(clear_credentials)
+        return _JSONResponse({"success": True})
+    except json.JSONDecodeError:
+        return _JSONResponse({"success": False, "error": "Invalid JSON body"}, status_code=400)
     except Exception as e:
         logger.exception("Logout failed")
-        return JSONResponse({"success": False, "error": str(e)})
+        return _JSONResponse({"success": False, "error": str(e)})
 
 
 async def run_stdio(server: Server) -> None:
@@ -154,15 +242,11 @@ async def run_http(
         async with session_manager.run():
             yield
 
-    # Create an ASGI app wrapper for the MCP endpoint
-    async def mcp_asgi_app(scope, receive, send):
-        await session_manager.handle_request(scope, receive, send)
-
     starlette_app = Starlette(
         lifespan=lifespan,
         routes=[
             # MCP streamable HTTP transport at /mcp
-            Mount("/mcp", app=mcp_asgi_app),
+            Mount("/mcp", app=session_manager.handle_request),
             # REST API for Tauri frontend
             Route("/api/health", endpoint=handle_health),
             Route("/api/auth-status", endpoint=handle_auth_status),
@@ -188,6 +272,11 @@ async def run_http(
         host=host,
         port=port,
         log_level="warning",
+        # Access lines are below the log level anyway; skip building them
+        access_log=False,
+        # The Starlette app defines a lifespan (the MCP session manager), so
+        # fail loudly instead of auto-detecting support on every startup
+        lifespan="on",
         ssl_certfile=str(ssl_certfile) if ssl_certfile else None,
         ssl_keyfile=str(ssl_keyfile) if ssl_keyfile else None,
     )
@@ -266,22 +355,23 @@ def build_config(args: argparse.Namespace) -> ServerConfig:
     cfg = ServerConfig.from_env()
 
     # Override with CLI arguments if provided
+    overrides: dict[str, Any] = {}
     if args.transport is not None:
-        cfg.transport = args.transport
+        overrides["transport"] = args.transport
     if args.host is not None:
-        cfg.host = args.host
+        overrides["host"] = args.host
     if args.port is not None:
-        cfg.port = args.port
+        overrides["port"] = args.port
     if args.log_level is not None:
-        cfg.log_level = args.log_level
+        overrides["log_level"] = args.log_level
     if args.data_dir is not None:
-        cfg.data_dir = Path(args.data_dir)
+        overrides["data_dir"] = Path(args.data_dir)
     if args.ssl_domain is not None:
-        cfg.ssl_domain = args.ssl_domain
+        overrides["ssl_domain"] = args.ssl_domain
     if args.ssl_port is not None:
-        cfg.ssl_port = args.ssl_port
+        overrides["ssl_port"] = args.ssl_port
 
-    return cfg
+    return dataclasses.replace(cfg, **overrides)
 
 
 async def _run_http_with_ssl(server: Server, cfg: ServerConfig) -> None:
@@ -294,9 +384,10 @@ async def _run_http_with_ssl(server: Server, cfg: ServerConfig) -> None:
         cfg: Server configuration
     """
     # Auto-restore TastyTrade session if credentials exist
-    if _tastytrade_service is not None:
+    service = get_tastytrade_service()
+    if service is not None:
         try:
-            if await _tastytrade_service.restore_session():
+            if await service.restore_session():
                 logger.info("TastyTrade session restored from stored credentials")
             else:
                 logger.warning("No stored credentials to restore TastyTrade session")
@@ -327,6 +418,32 @@ async def _run_http_with_ssl(server: Server, cfg: ServerConfig) -> None:
     await run_http(server, host, port, ssl_certfile, ssl_keyfile)
 
 
+def _has_display() -> bool:
+    """Whether a GUI can be shown.
+
+    Only Linux/BSD can lack a display server; an explicit QT_QPA_PLATFORM
+    (e.g. "offscreen") is trusted as is.
+    """
+    if sys.platform in ("darwin", "win32"):
+        return True
+    env = os.environ
+    return any(env.get(name) for name in ("DISPLAY", "WAYLAND_DISPLAY", "QT_QPA_PLATFORM"))
+
+
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Get the event loop factory for headless mode.
+
+    Uses uvloop when it is installed (optional, not available on Windows).
+    Returns None to use asyncio's default loop, which is already the Proactor
+    loop on Windows. The GUI runs on qasync's own loop and does not use this.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 def run() -> None:
     """Main entry point for TTAI.
 
@@ -338,17 +455,28 @@ def run() -> None:
     # Setup logging
     setup_logging(cfg.log_level, cfg.log_dir)
 
+    # Without a display Qt can't start at all; serve MCP without loading it
+    if not args.headless and not _has_display():
+        logger.warning("No display available, running in headless mode")
+        args.headless = True
+
     if not args.headless:
         # GUI mode (default)
         from src.gui.app import run_gui
 
+        # When run as a script (or frozen entry point) this module is __main__;
+        # register it under its package name too, so the GUI's import of it
+        # reuses this instance (and its _tastytrade_service) instead of
+        # executing the whole module a second time
+        sys.modules.setdefault("src.server.main", sys.modules[__name__])
+
         # If transport is also specified via env, run both GUI and server
         mcp_server = None
         tastytrade_svc = None
         if cfg.transport == "http":
             logger.info("TTAI starting in GUI mode with MCP server")
             mcp_server = create_server(cfg)
-            tastytrade_svc = _tastytrade_service
+            tastytrade_svc = get_tastytrade_service()
         else:
             logger.info("TTAI starting in GUI mode")
 
@@ -362,10 +490,11 @@ def run() -> None:
 
     # Run in appropriate mode
     try:
-        if cfg.transport == "http":
-            asyncio.run(_run_http_with_ssl(server, cfg))
-        else:
-            asyncio.run(run_stdio(server))
+        with asyncio.Runner(loop_factory=_event_loop_factory()) as runner:
+            if cfg.transport == "http":
+                runner.run(_run_http_with_ssl(server, cfg))
+            else:
+                runner.run(run_stdio(server))
     except KeyboardInterrupt:
         logger.info("Server stopped")
 
@@ -2,21 +2,28 @@
 
 import json
 import logging
+from collections.abc import Callable
+from typing import TYPE_CHECKING
 
 from mcp.server import Server
 from mcp.types import TextContent, Tool
 
-from src.services.tastytrade import TastyTradeService
+if TYPE_CHECKING:
+    from src.services.tastytrade import TastyTradeService
 
 logger = logging.getLogger("ttai.tools")
 
 
-def register_tools(server: Server, tastytrade_service: TastyTradeService) -> None:
+def register_tools(
+    server: Server,
+    get_tastytrade_service: Callable[[], "TastyTradeService | None"],
+) -> None:
     """Register all MCP tools with the server.
 
     Args:
         server: The MCP server instance to register tools with
-        tastytrade_service: TastyTrade service for API operations
+        get_tastytrade_service: Returns the TastyTrade service for API
+            operations; only called once a tool actually needs it
     """
 
     @server.list_tools()
@@ -111,6 +118,10 @@ def register_tools(server: Server, tastytrade_service: TastyTradeService) -> Non
         if name == "ping":
             return [TextContent(type="text", text="pong")]
 
+        tastytrade_service = get_tastytrade_service()
+        if tastytrade_service is None:
+            raise RuntimeError("TastyTrade service not initialized")
+
         if name == "login":
             client_secret = arguments["client_secret"]
             refresh_token = arguments["refresh_token"]
@@ -1,5 +1,6 @@
 """TastyTrade API service using the official SDK."""
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from decimal import Decimal
@@ -10,7 +11,7 @@ from tastytrade.instruments import InstrumentType
 from tastytrade.market_data import get_market_data
 from tastytrade.metrics import get_market_metrics
 
-from src.auth.credentials import CredentialManager
+from src.auth.credentials import CredentialManager, Credentials
 from src.services.cache import CacheService
 
 logger = logging.getLogger("ttai.tastytrade")
@@ -80,12 +81,18 @@ class TastyTradeService:
         self._credential_manager = credential_manager
         self._cache = cache
         self._session: Session | None = None
+        self._auth_state_version = 0
 
     @property
     def is_authenticated(self) -> bool:
         """Check if we have an active session."""
         return self._session is not None
 
+    @property
+    def auth_state_version(self) -> int:
+        """Counter bumped whenever login, restore or logout may change get_auth_status()."""
+        return self._auth_state_version
+
     async def login(
         self,
         client_secret: str,
@@ -102,6 +109,8 @@ class TastyTradeService:
         Returns:
             True if login successful, False otherwise
         """
+        # The version is bumped only after the state has changed, so a status
+        # read in between can't be cached under the new version
         try:
             self._session = Session(client_secret, refresh_token)
             logger.info("Successfully authenticated with TastyTrade OAuth")
@@ -112,28 +121,37 @@ class TastyTradeService:
                     refresh_token=refresh_token,
                 )
 
+            self._auth_state_version += 1
             return True
         except Exception as e:
             logger.error(f"Login failed: {e}")
             self._session = None
+            self._auth_state_version += 1
             return False
 
-    async def restore_session(self) -> bool:
+    async def restore_session(self, credentials: Credentials | None = None) -> bool:
         """Attempt to restore session from stored credentials.
 
+        Args:
+            credentials: Already-loaded credentials; loaded from storage if omitted
+
         Returns:
             True if session restored successfully, False otherwise
         """
-        credentials = self._credential_manager.load_credentials()
+        if credentials is None:
+            # Disk read + decrypt; keep it off the event loop
+            credentials = await asyncio.to_thread(self._credential_manager.load_credentials)
         if credentials is None:
             return False
 
         try:
             self._session = Session(credentials.client_secret, credentials.refresh_token)
             logger.info("Session restored using stored OAuth credentials")
+            self._auth_state_version += 1
             return True
         except Exception as e:
             logger.error(f"Failed to restore session: {e}")
+            self._auth_state_version += 1
             return False
 
     async def logout(self, clear_credentials: bool = True) -> None:
@@ -153,6 +171,8 @@ class TastyTradeService:
         if clear_credentials:
             self._credential_manager.clear_credentials()
 
+        self._auth_state_version += 1
+
         logger.info("Logged out successfully")
 
     async def get_quote(self, symbol: str) -> QuoteData | None:
@@ -0,0 +1,85 @@
+"""Tests for authentication modules."""
+
+import json
+import stat
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+from cryptography.fernet import Fernet
+
+from src.auth.credentials import CredentialManager
+
+
+class TestCredentialManager:
+    """Tests for CredentialManager."""
+
+    def test_store_and_load(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = CredentialManager(Path(tmpdir))
+            manager.store_credentials("secret", "token")
+            credentials = manager.load_credentials()
+            assert credentials is not None
+            assert credentials.client_secret == "secret"
+            assert credentials.refresh_token == "token"
+
+    def test_load_missing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = CredentialManager(Path(tmpdir))
+            assert manager.has_credentials() is False
+            assert manager.load_credentials() is None
+
+    def test_clear(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = CredentialManager(Path(tmpdir))
+            manager.store_credentials("secret", "token")
+            assert manager.has_credentials() is True
+            manager.clear_credentials()
+            assert manager.has_credentials() is False
+
+    def test_new_manager_reads_stored_credentials(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            CredentialManager(Path(tmpdir)).store_credentials("secret", "token")
+            credentials = CredentialManager(Path(tmpdir)).load_credentials()
+            assert credentials is not None
+            assert credentials.refresh_token == "token"
+
+    def test_deleted_key_file_is_not_reused(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = CredentialManager(Path(tmpdir))
+            manager.store_credentials("secret", "token")
+            (Path(tmpdir) / ".key").unlink()
+            manager.store_credentials("secret", "token2")
+            # Readable with the key now on disk, as after a restart
+            key = (Path(tmpdir) / ".key").read_bytes()
+            encrypted = (Path(tmpdir) / ".credentials").read_bytes()
+            assert b"token2" in Fernet(key).decrypt(encrypted)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions only")
+    def test_files_are_owner_only(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            CredentialManager(Path(tmpdir)).store_credentials("secret", "token")
+            for name in (".key", ".credentials"):
+                mode = stat.S_IMODE((Path(tmpdir) / name).stat().st_mode)
+                assert mode == 0o600
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions only")
+    def test_existing_file_permissions_are_tightened(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            credentials_path = Path(tmpdir) / ".credentials"
+            credentials_path.touch(mode=0o644)
+            credentials_path.chmod(0o644)
+            CredentialManager(Path(tmpdir)).store_credentials("secret", "token")
+            assert stat.S_IMODE(credentials_path.stat().st_mode) == 0o600
+
+    def test_load_legacy_json(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = CredentialManager(Path(tmpdir))
+            legacy = json.dumps({"client_secret": "secret", "refresh_token": "token"})
+            encrypted = manager._get_fernet().encrypt(legacy.encode())
+            (Path(tmpdir) / ".credentials").write_bytes(encrypted)
+            credentials = manager.load_credentials()
+            assert credentials is not None
+            assert credentials.client_secret == "secret"
+            assert credentials.refresh_token == "token"
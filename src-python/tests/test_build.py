@@ -0,0 +1,168 @@
+"""Tests for the pure helpers of the PyInstaller build script."""
+
+import importlib.util
+import os
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+# scripts/ is not a package, so load build.py by path
+_spec = importlib.util.spec_from_file_location(
+    "build", Path(__file__).parent.parent / "scripts" / "build.py"
+)
+assert _spec is not None and _spec.loader is not None
+build = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(build)
+
+
+class TestArchiveCompression:
+    """Tests for get_archive_compression."""
+
+    def test_default_is_fast_deflate(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("TTAI_ARCHIVE_COMPRESSION", raising=False)
+        assert build.get_archive_compression() == (zipfile.ZIP_DEFLATED, 1)
+
+    def test_case_insensitive(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("TTAI_ARCHIVE_COMPRESSION", "STORE")
+        assert build.get_archive_compression() == (zipfile.ZIP_STORED, None)
+
+    def test_unknown_mode(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("TTAI_ARCHIVE_COMPRESSION", "bzip2")
+        with pytest.raises(ValueError, match="bzip2"):
+            build.get_archive_compression()
+
+
+class TestIncrementalMode:
+    """Tests for get_incremental_mode."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("1", True),
+            ("yes", True),
+            (" On ", True),
+            ("0", False),
+            ("false", False),
+            ("", False),
+            ("maybe", None),
+        ],
+    )
+    def test_values(
+        self, monkeypatch: pytest.MonkeyPatch, value: str, expected: bool | None
+    ) -> None:
+        monkeypatch.setenv("TTAI_INCREMENTAL", value)
+        assert build.get_incremental_mode() is expected
+
+    def test_unset(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("TTAI_INCREMENTAL", raising=False)
+        assert build.get_incremental_mode() is None
+
+
+class TestBuildCacheKey:
+    """Tests for build_cache_key."""
+
+    def test_stable_for_same_inputs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            lockfile = Path(tmpdir) / "uv.lock"
+            lockfile.write_text("a")
+            assert build.build_cache_key(["x"], lockfile) == build.build_cache_key(["x"], lockfile)
+
+    def test_changes_with_command_and_lockfile(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            lockfile = Path(tmpdir) / "uv.lock"
+            missing = build.build_cache_key(["x"], lockfile)
+            lockfile.write_text("a")
+            key = build.build_cache_key(["x"], lockfile)
+
+            assert key != missing
+            assert build.build_cache_key(["y"], lockfile) != key
+            lockfile.write_text("b")
+            assert build.build_cache_key(["x"], lockfile) != key
+
+
+class TestMakeZip:
+    """Tests for make_zip."""
+
+    def test_round_trip(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Small limits so the tree exercises batching and streaming
+        monkeypatch.setattr(build, "ZIP_READ_AHEAD_BYTES", 10)
+        monkeypatch.setattr(build, "ZIP_STREAM_THRESHOLD", 100)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            app = root / "app"
+            (app / "lib").mkdir(parents=True)
+            files = {
+                "app/a.txt": b"alpha",
+                "app/b.txt": b"bravo!",
+                "app/lib/big.bin": os.urandom(500),
+            }
+            for name, data in files.items():
+                (root / name).write_bytes(data)
+            zip_path = root / "out.zip"
+
+            total = build.make_zip(zip_path, root, "app", build.ARCHIVE_COMPRESSION["deflate"])
+
+            assert total == sum(len(data) for data in files.values())
+            with zipfile.ZipFile(zip_path) as zf:
+                assert "app/lib/" in zf.namelist()
+                for name, data in files.items():
+                    assert zf.read(name) == data
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="symlinks need privileges on Windows")
+    def test_symlinked_dir_not_followed(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "app" / "real").mkdir(parents=True)
+            (root / "app" / "real" / "f.txt").write_text("x")
+            (root / "app" / "link").symlink_to("real")
+            zip_path = root / "out.zip"
+
+            total = build.make_zip(zip_path, root, "app", build.ARCHIVE_COMPRESSION["store"])
+
+            assert total == 1
+            with zipfile.ZipFile(zip_path) as zf:
+                names = zf.namelist()
+            assert "app/real/f.txt" in names
+            assert "app/link/f.txt" not in names
+
+
+class TestCleanupBundle:
+    """Tests for cleanup_bundle."""
+
+    def test_removes_unused_qt(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bundle = Path(tmpdir) / "ttai"
+            internal = bundle / "_internal"
+            qt = internal / "PySide6" / "Qt"
+            (qt / "lib" / "QtWebEngineCore.framework").mkdir(parents=True)
+            (qt / "lib" / "QtWebEngineCore.framework" / "lib").write_bytes(b"x" * 10)
+            (qt / "lib" / "QtCore.framework").mkdir()
+            (qt / "lib" / "QtPdf").write_bytes(b"x")
+            (qt / "plugins" / "multimedia").mkdir(parents=True)
+            (qt / "plugins" / "platforms").mkdir()
+            (qt / "translations").mkdir()
+            (internal / "mypy").mkdir()
+
+            build.cleanup_bundle(bundle)
+
+            assert sorted(p.name for p in (qt / "lib").iterdir()) == ["QtCore.framework"]
+            assert sorted(p.name for p in (qt / "plugins").iterdir()) == ["platforms"]
+            assert not (qt / "translations").exists()
+            assert not (internal / "mypy").exists()
+
+    def test_missing_bundle(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            build.cleanup_bundle(Path(tmpdir) / "missing")
+
+
+class TestQtModules:
+    """Tests for get_qt_modules."""
+
+    def test_finds_app_imports(self) -> None:
+        modules = build.get_qt_modules()
+        assert "PySide6.QtWidgets" in modules
+        assert all(name.startswith("PySide6.") for name in modules)
+        assert list(modules) == sorted(modules)
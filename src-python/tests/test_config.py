@@ -0,0 +1,69 @@
+"""Tests for server configuration."""
+
+import dataclasses
+import logging
+from pathlib import Path
+
+import pytest
+
+# Importing src.server pulls in the HTTP server stack
+pytest.importorskip("uvicorn")
+pytest.importorskip("mcp")
+
+from src.server.config import ServerConfig  # noqa: E402
+
+
+class TestServerConfig:
+    """Tests for ServerConfig."""
+
+    def test_from_env_reads_values(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("TTAI_TRANSPORT", "STDIO")
+        monkeypatch.setenv("TTAI_PORT", "6000")
+        monkeypatch.setenv("TTAI_DATA_DIR", "/tmp/ttai-test")
+
+        cfg = ServerConfig.from_env()
+
+        assert cfg.transport == "stdio"
+        assert cfg.port == 6000
+        assert cfg.db_path == Path("/tmp/ttai-test/ttai.db")
+
+    def test_invalid_int_falls_back_with_warning(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        monkeypatch.setenv("TTAI_PORT", "not-a-port")
+        monkeypatch.setenv("TTAI_SSL_PORT", "")
+
+        with caplog.at_level(logging.WARNING, logger="ttai.server"):
+            cfg = ServerConfig.from_env()
+
+        assert cfg.port == 5180
+        assert cfg.ssl_port == 5181
+        assert "TTAI_PORT" in caplog.text
+        assert "TTAI_SSL_PORT" not in caplog.text
+
+    def test_is_immutable(self) -> None:
+        cfg = ServerConfig()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            cfg.port = 1234  # type: ignore[misc]
+
+    def test_replace_recomputes_derived_values(self) -> None:
+        cfg = ServerConfig(data_dir=Path("/a"), ssl_domain="example.com")
+        assert cfg.log_dir == Path("/a/logs")
+        assert cfg.ssl_local_domain == "local.example.com"
+
+        updated = dataclasses.replace(cfg, data_dir=Path("/b"), ssl_domain="")
+
+        assert updated.log_dir == Path("/b/logs")
+        assert updated.ssl_cert_dir == Path("/b/ssl")
+        assert updated.ssl_local_domain == ""
+        assert updated.ssl_cert_api == ""
+        assert not updated.ssl_enabled
+        # The original keeps its cached values
+        assert cfg.log_dir == Path("/a/logs")
+        assert cfg.ssl_enabled
+
+    def test_cert_api_override(self) -> None:
+        cfg = ServerConfig(ssl_cert_api_override="http://localhost:9000/cert")
+
+        assert cfg.ssl_cert_api == "http://localhost:9000/cert"
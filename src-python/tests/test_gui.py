@@ -0,0 +1,104 @@
+"""Tests for the GUI's non-visual state classes."""
+
+import tempfile
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+pytest.importorskip("PySide6")
+pytest.importorskip("qasync")
+
+from PySide6.QtCore import QCoreApplication, QSettings  # noqa: E402
+
+from src.gui.preferences import PreferencesManager  # noqa: E402
+from src.gui.state import AppState  # noqa: E402
+
+
+class TestAppState:
+    """Tests for AppState."""
+
+    def test_update_many_stores_all_before_signals(self) -> None:
+        state = AppState()
+        seen: list[tuple[str, Any, bool, bool]] = []
+        state.authenticated_changed.connect(
+            lambda value: seen.append(
+                ("authenticated", value, state.authenticated, state.has_stored_credentials)
+            )
+        )
+        state.has_stored_credentials_changed.connect(
+            lambda value: seen.append(
+                ("has_stored_credentials", value, state.authenticated, state.has_stored_credentials)
+            )
+        )
+
+        changed = state.update_many({"authenticated": True, "has_stored_credentials": True})
+
+        assert changed == ["authenticated", "has_stored_credentials"]
+        # Each slot already sees both new values
+        assert seen == [
+            ("authenticated", True, True, True),
+            ("has_stored_credentials", True, True, True),
+        ]
+
+    def test_unchanged_values_do_not_emit(self) -> None:
+        state = AppState()
+        emitted: list[bool] = []
+        state.is_logging_in_changed.connect(emitted.append)
+
+        assert state.update_many({"is_logging_in": False}) == []
+        state.is_logging_in = True
+        state.is_logging_in = True
+
+        assert emitted == [True]
+
+    def test_none_emits_default(self) -> None:
+        state = AppState()
+        emitted: list[str] = []
+        state.login_error_changed.connect(emitted.append)
+
+        state.login_error = "bad token"
+        state.login_error = None
+
+        assert emitted == ["bad token", ""]
+        assert state.login_error is None
+
+
+class TestPreferencesManager:
+    """Tests for PreferencesManager."""
+
+    @pytest.fixture(autouse=True)
+    def _settings(self) -> Iterator[None]:
+        app = QCoreApplication.instance() or QCoreApplication([])
+        app.setOrganizationName("TTAI-tests")
+        app.setApplicationName("TTAI-tests")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            QSettings.setDefaultFormat(QSettings.Format.IniFormat)
+            QSettings.setPath(QSettings.Format.IniFormat, QSettings.Scope.UserScope, tmpdir)
+            yield
+
+    def test_defaults(self) -> None:
+        prefs = PreferencesManager()
+        assert prefs.is_first_run is True
+        assert prefs.show_window_on_launch is True
+
+    def test_setters_write_through(self) -> None:
+        prefs = PreferencesManager()
+        prefs.mark_first_run_complete()
+        prefs.show_window_on_launch = False
+        prefs.sync()
+
+        assert prefs.is_first_run is False
+        assert prefs.show_window_on_launch is False
+        reloaded = PreferencesManager()
+        assert reloaded.is_first_run is False
+        assert reloaded.show_window_on_launch is False
+
+    def test_invalidate_rereads_settings(self) -> None:
+        prefs = PreferencesManager()
+        QSettings().setValue(PreferencesManager.KEY_IS_FIRST_RUN, False)
+        assert prefs.is_first_run is True
+
+        prefs.invalidate()
+
+        assert prefs.is_first_run is False
@@ -0,0 +1,82 @@
+"""Tests for the MCP server's REST API."""
+
+import json
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+pytest.importorskip("uvicorn")
+pytest.importorskip("mcp")
+pytest.importorskip("starlette")
+
+from src.server import main  # noqa: E402
+
+
+class _FakeService:
+    """Minimal TastyTradeService that counts get_auth_status calls."""
+
+    def __init__(self) -> None:
+        self.auth_state_version = 0
+        self.authenticated = False
+        self.status_calls = 0
+
+    def get_auth_status(self) -> dict[str, Any]:
+        self.status_calls += 1
+        return {"authenticated": self.authenticated, "has_stored_credentials": False}
+
+
+class TestAuthStatus:
+    """Tests for the cached /api/auth-status handler."""
+
+    @pytest.fixture
+    def service(self, monkeypatch: pytest.MonkeyPatch) -> _FakeService:
+        service = _FakeService()
+        monkeypatch.setattr(main, "_tastytrade_service", service)
+        monkeypatch.setattr(main, "_auth_status_cache", None)
+        return service
+
+    @pytest.fixture
+    def clock(self, monkeypatch: pytest.MonkeyPatch) -> list[float]:
+        # Replace the module's time rather than time.monotonic, which the
+        # event loop running the test also reads
+        now = [100.0]
+        monkeypatch.setattr(main, "time", SimpleNamespace(monotonic=lambda: now[0]))
+        return now
+
+    async def _status(self) -> dict[str, Any]:
+        response = await main.handle_auth_status(None)  # type: ignore[arg-type]
+        return json.loads(response.body)
+
+    @pytest.mark.asyncio
+    async def test_reused_within_ttl(self, service: _FakeService, clock: list[float]) -> None:
+        assert await self._status() == {"authenticated": False, "has_stored_credentials": False}
+        clock[0] += main._AUTH_STATUS_TTL / 2
+        await self._status()
+        assert service.status_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_refreshed_after_version_bump(
+        self, service: _FakeService, clock: list[float]
+    ) -> None:
+        await self._status()
+        service.authenticated = True
+        service.auth_state_version += 1
+
+        assert (await self._status())["authenticated"] is True
+        assert service.status_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_refreshed_after_ttl(self, service: _FakeService, clock: list[float]) -> None:
+        await self._status()
+        clock[0] += main._AUTH_STATUS_TTL + 0.1
+        await self._status()
+        assert service.status_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_service_not_initialized(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(main, "_tastytrade_service", None)
+        monkeypatch.setattr(main, "_tastytrade_data_dir", None)
+
+        response = await main.handle_auth_status(None)  # type: ignore[arg-type]
+        assert response.status_code == 500
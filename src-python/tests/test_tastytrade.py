@@ -0,0 +1,80 @@
+"""Tests for the TastyTrade service."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("tastytrade")
+
+from src.auth.credentials import CredentialManager  # noqa: E402
+from src.services import tastytrade  # noqa: E402
+from src.services.cache import CacheService  # noqa: E402
+from src.services.tastytrade import TastyTradeService  # noqa: E402
+
+
+class _FakeSession:
+    """Stands in for tastytrade.Session so no request leaves the test."""
+
+    def __init__(self, client_secret: str, refresh_token: str) -> None:
+        if client_secret == "bad":
+            raise ValueError("invalid credentials")
+
+    def destroy(self) -> None:
+        pass
+
+
+class TestAuthStateVersion:
+    """Tests for TastyTradeService.auth_state_version."""
+
+    @pytest.fixture(autouse=True)
+    def _fake_session(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(tastytrade, "Session", _FakeSession)
+
+    @pytest.mark.asyncio
+    async def test_bumped_on_login_and_logout(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = TastyTradeService(CredentialManager(Path(tmpdir)), CacheService())
+            assert service.auth_state_version == 0
+
+            assert await service.login("secret", "token", remember_me=True)
+            assert service.auth_state_version == 1
+            assert service.get_auth_status() == {
+                "authenticated": True,
+                "has_stored_credentials": True,
+            }
+
+            await service.logout()
+            assert service.auth_state_version == 2
+            assert service.get_auth_status() == {
+                "authenticated": False,
+                "has_stored_credentials": False,
+            }
+
+    @pytest.mark.asyncio
+    async def test_bumped_on_failed_login(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = TastyTradeService(CredentialManager(Path(tmpdir)), CacheService())
+
+            assert not await service.login("bad", "token")
+            assert service.auth_state_version == 1
+            assert not service.is_authenticated
+
+    @pytest.mark.asyncio
+    async def test_restore_without_credentials_keeps_version(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = TastyTradeService(CredentialManager(Path(tmpdir)), CacheService())
+
+            assert not await service.restore_session()
+            assert service.auth_state_version == 0
+
+    @pytest.mark.asyncio
+    async def test_bumped_on_restore(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = CredentialManager(Path(tmpdir))
+            manager.store_credentials("secret", "token")
+            service = TastyTradeService(manager, CacheService())
+
+            assert await service.restore_session()
+            assert service.auth_state_version == 1
+            assert service.is_authenticated